@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from core.memory_manager import MemoryManager
@@ -54,6 +54,7 @@ class ChatHistoryResponse(BaseModel):
     session_id: str
     messages: List[MessageResponse]
     total: int
+    next_cursor: Optional[int] = None
 
 
 class LearnedFactsRequest(BaseModel):
@@ -110,18 +111,25 @@ async def add_message(payload: MessageCreate) -> MessageResponse:
 @router.get("/sessions/{session_id}/history", response_model=ChatHistoryResponse)
 async def get_chat_history(
     session_id: str,
-    limit: int = 50,
+    cursor: int = Query(default=0, ge=0),
+    limit: int = Query(default=50, ge=1),
 ) -> ChatHistoryResponse:
-    """Retrieve chat history for a session."""
+    """Retrieve chat history for a session, one page at a time.
+
+    Pages walk back from the newest message; pass ``next_cursor`` as
+    ``cursor`` to fetch the next older page.
+    """
     try:
-        messages = memory_manager.get_chat_history(
+        messages, next_cursor = memory_manager.page_history(
             session_id=session_id,
+            cursor=cursor,
             limit=limit,
         )
         return ChatHistoryResponse(
             session_id=session_id,
             messages=[MessageResponse(**msg) for msg in messages],
             total=len(messages),
+            next_cursor=next_cursor,
         )
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
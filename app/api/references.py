@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException
@@ -11,6 +12,12 @@ from shared.tools.vector_references import VectorReferenceStore, get_vector_stor
 
 router = APIRouter(prefix="/references", tags=["references"])
 
+# Embedding jobs run on worker threads so their API calls do not block the
+# event loop; each job already keeps several requests in flight, so only a
+# couple run at once.
+EMBED_JOBS = 2
+_embed_slots = asyncio.Semaphore(EMBED_JOBS)
+
 
 class SearchRequest(BaseModel):
     """Request to search references."""
@@ -42,6 +49,22 @@ class SearchResponse(BaseModel):
     search_type: str
 
 
+class BatchSearchRequest(BaseModel):
+    """Request to run several vector searches at once."""
+
+    queries: List[str] = Field(..., min_length=1, max_length=64)
+    skill_id: Optional[str] = None
+    limit: int = Field(default=5, ge=1, le=20)
+
+
+class BatchSearchResponse(BaseModel):
+    """Vector search results, one list per query."""
+
+    queries: List[str]
+    results: List[List[SearchResult]]
+    search_type: str = "vector"
+
+
 class EmbedRequest(BaseModel):
     """Request to embed skill references."""
 
@@ -80,27 +103,36 @@ async def search_references(payload: SearchRequest) -> SearchResponse:
                 search_type="vector",
             )
         else:
-            # Keyword search - use the tool directly
-            from shared.tools.references import search_skill_references
-
-            # Mock agent for tool call
-            class MockAgent:
-                pass
-
-            result_text = search_skill_references(MockAgent(), payload.query)
-
-            # Parse results (simple implementation - returns formatted text)
+            # Keyword search over the inverted index of reference paragraphs
+            from core import skill_orchestrator
+            from shared.tools.references import reference_index
+
+            skill_ids = (
+                [payload.skill_id]
+                if payload.skill_id
+                else [skill.id for skill in skill_orchestrator.catalog()]
+            )
+            sources = []
+            for skill_id in skill_ids:
+                try:
+                    package = skill_orchestrator.registry.load_skill(skill_id)
+                except KeyError:
+                    continue
+                sources.extend((skill_id, path) for path in package.references)
+
+            hits = reference_index(sources).search(payload.query, payload.limit)
             return SearchResponse(
                 query=payload.query,
                 results=[
                     SearchResult(
-                        skill_id=payload.skill_id or "all",
-                        file_path="",
-                        content=result_text,
-                        chunk_index=0,
+                        skill_id=chunk.skill_id,
+                        file_path=str(chunk.file_path),
+                        content=chunk.read(),
+                        chunk_index=chunk.chunk_index,
                     )
+                    for _, chunk in hits
                 ],
-                total=1,
+                total=len(hits),
                 search_type="keyword",
             )
 
@@ -108,6 +140,29 @@ async def search_references(payload: SearchRequest) -> SearchResponse:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@router.post("/search/batch", response_model=BatchSearchResponse)
+async def search_references_batch(payload: BatchSearchRequest) -> BatchSearchResponse:
+    """
+    Vector search for several queries in one call.
+
+    The queries share one embeddings request and one database round trip.
+    """
+    try:
+        store = get_vector_store()
+        results = store.search_batch(
+            queries=payload.queries,
+            skill_id=payload.skill_id,
+            limit=payload.limit,
+        )
+        return BatchSearchResponse(
+            queries=payload.queries,
+            results=[[SearchResult(**r) for r in rows] for rows in results],
+        )
+
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
 @router.post("/embed", response_model=EmbedResponse)
 async def embed_skill_references(payload: EmbedRequest) -> EmbedResponse:
     """
@@ -143,11 +198,13 @@ async def embed_skill_references(payload: EmbedRequest) -> EmbedResponse:
 
         # Embed references
         store = get_vector_store()
-        chunks_indexed = store.embed_references(
-            skill_id=payload.skill_id,
-            reference_paths=skill_package.references,
-            chunk_size=payload.chunk_size,
-        )
+        async with _embed_slots:
+            chunks_indexed = await asyncio.to_thread(
+                store.embed_references,
+                skill_id=payload.skill_id,
+                reference_paths=skill_package.references,
+                chunk_size=payload.chunk_size,
+            )
 
         return EmbedResponse(
             skill_id=payload.skill_id,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable, List, Optional
 
 from fastapi import APIRouter, HTTPException
@@ -23,7 +24,9 @@ class SkillMetadataResponse(BaseModel):
 
     @classmethod
     def from_metadata(cls, metadata: SkillMetadata) -> "SkillMetadataResponse":
-        return cls(
+        # Skill metadata is validated when the manifest is parsed, so the
+        # response is assembled without re-running field validation.
+        return cls.model_construct(
             id=metadata.id,
             name=metadata.name,
             description=metadata.description,
@@ -33,6 +36,12 @@ class SkillMetadataResponse(BaseModel):
         )
 
 
+@lru_cache(maxsize=1024)
+def _metadata_response(metadata: SkillMetadata) -> SkillMetadataResponse:
+    """Response model for *metadata*, reused until the manifest changes."""
+    return SkillMetadataResponse.from_metadata(metadata)
+
+
 class RouteRequest(BaseModel):
     message: str = Field(..., description="User message to analyse for relevant skills")
     limit: Optional[int] = Field(
@@ -77,8 +86,7 @@ class CreateSkillResponse(BaseModel):
 @router.get("", response_model=List[SkillMetadataResponse])
 async def list_skills() -> List[SkillMetadataResponse]:
     return [
-        SkillMetadataResponse.from_metadata(metadata)
-        for metadata in skill_orchestrator.catalog()
+        _metadata_response(metadata) for metadata in skill_orchestrator.catalog()
     ]
 
 
@@ -90,8 +98,8 @@ async def route_skills(payload: RouteRequest) -> RouteResponse:
         tags=payload.tags,
         min_score=payload.min_score,
     )
-    return RouteResponse(
-        skills=[SkillMetadataResponse.from_metadata(metadata) for metadata in matches]
+    return RouteResponse.model_construct(
+        skills=[_metadata_response(metadata) for metadata in matches]
     )
 
 
@@ -102,11 +110,10 @@ async def reload_skills() -> ReloadResponse:
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
-    return ReloadResponse(
+    return ReloadResponse.model_construct(
         status="reloaded",
         skills=[
-            SkillMetadataResponse.from_metadata(metadata)
-            for metadata in skill_orchestrator.catalog()
+            _metadata_response(metadata) for metadata in skill_orchestrator.catalog()
         ],
     )
 
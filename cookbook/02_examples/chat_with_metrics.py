@@ -6,6 +6,7 @@ similar to the AgentOS chat interface.
 """
 
 import asyncio
+import time
 import uuid
 from datetime import datetime
 from typing import List, Dict, Any
@@ -91,7 +92,9 @@ class MetricsEnabledChat:
             ),
         )
         metrics.input_text = user_input
-        metrics.performance.start_time = datetime.utcnow().timestamp()
+        metrics.performance.agent_name = self.agent.name
+        metrics.performance.model_name = metrics.metadata["model_name"]
+        metrics.performance.start_time_ns = time.monotonic_ns()
 
         try:
             # Get agent response
@@ -125,6 +128,10 @@ class MetricsEnabledChat:
             metrics.error = str(e)
             raise
 
+        finally:
+            # Completed executions only count in aggregates once finalized
+            self.metrics_collector.finalize(metrics)
+
     def get_conversation_stats(self) -> Dict[str, Any]:
         """Get statistics for the current conversation."""
         agent_messages = [m for m in self.messages if m.role == "assistant"]
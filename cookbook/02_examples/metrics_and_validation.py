@@ -74,8 +74,8 @@ async def example_with_metrics():
 
     print(f"\nValidation Status: {validation_result.status.value}")
     print(f"Confidence Score: {validation_result.confidence_score:.2%}")
-    print(f"Factual Claims Found: {len(validation_result.factual_claims)}")
-    print(f"Verified Claims: {len(validation_result.verified_claims)}")
+    print(f"Factual Claims Found: {validation_result.factual_claims_count}")
+    print(f"Verified Claims: {validation_result.verified_claims_count}")
 
     if validation_result.hallucination_indicators:
         print(f"\nHallucination Indicators:")
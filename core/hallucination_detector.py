@@ -11,6 +11,21 @@ from pydantic import BaseModel, Field
 
 from .metrics_collector import ValidationMetrics, ValidationStatus
 
+_CHECK_HEADER = (
+    "Analyze this AI-generated response for hallucinations and factual accuracy:\n"
+    "\n"
+    "RESPONSE TO CHECK:\n"
+)
+
+_CHECK_FOOTER = """
+Provide a detailed analysis of:
+1. Each factual claim made
+2. Whether each claim is likely factual or hallucinated
+3. Confidence level for each assessment
+4. Overall hallucination risk
+5. Specific indicators that suggest hallucination
+"""
+
 
 class FactCheckResult(BaseModel):
     """Result of fact-checking a single claim."""
@@ -102,18 +117,34 @@ class HallucinationDetector:
 
         # Extract factual claims
         claims = self._extract_claims(response_text)
-        metrics.factual_claims = claims
+        metrics.factual_claims_count = len(claims)
 
         # If deep checking is enabled, use the fact-checking agent
         if self.enable_deep_check and claims:
+            # Skip the LLM round trip when the heuristics are already decisive:
+            # short responses with no indicators and few claims, or responses
+            # with overwhelming indicator counts.
+            if (
+                not quick_indicators
+                and len(claims) <= 2
+                and len(response_text.split()) < 30
+            ):
+                metrics.status = ValidationStatus.UNVERIFIED
+                metrics.confidence_score = 0.9
+                return metrics
+            if len(quick_indicators) >= 5:
+                metrics.status = ValidationStatus.HALLUCINATION
+                metrics.confidence_score = 0.2
+                return metrics
+
             check_result = self._deep_fact_check(
                 response_text, context, reference_knowledge
             )
 
             metrics.confidence_score = check_result.confidence_score
-            metrics.verified_claims = [
-                c.claim for c in check_result.claims if c.is_factual
-            ]
+            metrics.verified_claims_count = sum(
+                1 for c in check_result.claims if c.is_factual
+            )
             metrics.hallucination_indicators.extend(
                 check_result.hallucination_indicators
             )
@@ -129,9 +160,8 @@ class HallucinationDetector:
             else:
                 metrics.status = ValidationStatus.INVALID
 
-            # Add reasoning steps
-            metrics.reasoning_steps.append(check_result.reasoning)
-            metrics.reasoning_steps.append(check_result.overall_assessment)
+            # Reasoning and overall assessment
+            metrics.reasoning_steps_count += 2
 
         else:
             # Without deep checking, use heuristics only
@@ -222,32 +252,14 @@ class HallucinationDetector:
         reference_knowledge: Optional[List[str]] = None,
     ) -> HallucinationCheckResult:
         """Perform deep fact-checking using the fact-checking agent."""
-        check_prompt = f"""Analyze this AI-generated response for hallucinations and factual accuracy:
-
-RESPONSE TO CHECK:
-{response_text}
-"""
-
+        parts = [_CHECK_HEADER, response_text, "\n"]
         if context:
-            check_prompt += f"""
-ORIGINAL CONTEXT/QUESTION:
-{context}
-"""
-
+            parts += ["\nORIGINAL CONTEXT/QUESTION:\n", context, "\n"]
         if reference_knowledge:
-            check_prompt += f"""
-VERIFIED KNOWLEDGE SOURCES:
-{chr(10).join(f"- {k}" for k in reference_knowledge[:5])}
-"""
-
-        check_prompt += """
-Provide a detailed analysis of:
-1. Each factual claim made
-2. Whether each claim is likely factual or hallucinated
-3. Confidence level for each assessment
-4. Overall hallucination risk
-5. Specific indicators that suggest hallucination
-"""
+            parts.append("\nVERIFIED KNOWLEDGE SOURCES:\n")
+            parts.extend(f"- {k}\n" for k in reference_knowledge[:5])
+        parts.append(_CHECK_FOOTER)
+        check_prompt = "".join(parts)
 
         result = self.fact_check_agent.run(check_prompt)
         return result.content
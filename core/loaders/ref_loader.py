@@ -2,23 +2,36 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import List
 
 
 def load_references_from_dir(directory: Path) -> List[Path]:
-    """Return every file path inside *directory* (recursively).
+    """Return every file path inside *directory* (recursively), sorted.
 
     The loader keeps paths as ``Path`` objects so that calling code can
     decide how and when to open the resources (for example, embedding them
-    into a vector store on first use).
+    into a vector store on first use). Symlinked files are included, but
+    symlinked directories are not descended into.
     """
 
-    if not directory.exists() or not directory.is_dir():
+    if not directory.is_dir():
         return []
 
-    references: List[Path] = []
-    for path in sorted(directory.rglob("*")):
-        if path.is_file():
-            references.append(path)
-    return references
+    file_paths: List[str] = []
+    _collect_files(os.fspath(directory), file_paths)
+    # Order by path components, matching how ``Path`` objects compare.
+    file_paths.sort(key=lambda file_path: file_path.split(os.sep))
+    return [Path(file_path) for file_path in file_paths]
+
+
+def _collect_files(directory: str, out: List[str]) -> None:
+    # scandir exposes the entry type from the directory listing itself, so
+    # each entry is classified without an extra stat call.
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _collect_files(entry.path, out)
+            elif entry.is_file():
+                out.append(entry.path)
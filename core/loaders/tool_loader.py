@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import hashlib
-import importlib
 import importlib.util
-import inspect
-import sys
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import ModuleType
-from typing import Any, List
+from typing import Any, Dict, List, Tuple
+
+# Imported tool modules keyed by source path, tagged with the content digest
+# they were executed from. Unchanged files are served from here; editing a
+# file changes its digest and forces a fresh import.
+_MODULE_CACHE: Dict[Path, Tuple[str, ModuleType]] = {}
+_MODULE_CACHE_LOCK = threading.Lock()
+_MAX_IMPORT_WORKERS = min(8, os.cpu_count() or 4)
 
 
 def load_tools_from_dir(directory: Path) -> List[Any]:
@@ -28,10 +35,22 @@ def load_tools_from_dir(directory: Path) -> List[Any]:
     if not directory.exists() or not directory.is_dir():
         return tools
 
-    for file_path in sorted(directory.glob("*.py")):
-        if file_path.name.startswith("__"):
-            continue
-        module = _import_module_from_path(file_path)
+    files = [
+        file_path
+        for file_path in sorted(directory.glob("*.py"))
+        if not file_path.name.startswith("__")
+    ]
+    if len(files) > 1:
+        # Module execution is dominated by file reads, bytecode compilation and
+        # third-party imports, so threads overlap well. Results keep file order.
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_IMPORT_WORKERS, len(files))
+        ) as executor:
+            modules = list(executor.map(_import_module_from_path, files))
+    else:
+        modules = [_import_module_from_path(file_path) for file_path in files]
+
+    for module in modules:
         if module is None:
             continue
         tools.extend(_extract_tools(module))
@@ -46,26 +65,29 @@ def _import_module_from_path(path: Path) -> ModuleType | None:
         return None
 
     digest = hashlib.blake2s(source_bytes, digest_size=12).hexdigest()
+    cache_key = path.resolve()
+    with _MODULE_CACHE_LOCK:
+        cached = _MODULE_CACHE.get(cache_key)
+    if cached is not None and cached[0] == digest:
+        return cached[1]
+
+    # The digest in the module name keeps each revision of a file distinct.
     module_name = f"skill_module_{path.stem}_{digest}"
-    pycache_dir = path.parent / "__pycache__"
-    if pycache_dir.exists():
-        for pycache_file in pycache_dir.glob(f"{path.stem}.*.pyc"):
-            try:
-                pycache_file.unlink()
-            except OSError:
-                continue
-    importlib.invalidate_caches()
-    if module_name in sys.modules:
-        del sys.modules[module_name]
     spec = importlib.util.spec_from_file_location(module_name, path)
     if spec is None or spec.loader is None:
         return None
 
     module = importlib.util.module_from_spec(spec)
     try:
-        spec.loader.exec_module(module)  # type: ignore[assignment]
+        # Compile the bytes that were hashed rather than going through the
+        # loader: a pyc written for an earlier revision with the same mtime
+        # and size could otherwise be executed in place of the new source.
+        code = compile(source_bytes, str(path), "exec", dont_inherit=True)
+        exec(code, module.__dict__)
     except Exception:
         return None
+    with _MODULE_CACHE_LOCK:
+        _MODULE_CACHE[cache_key] = (digest, module)
     return module
 
 
@@ -88,13 +110,16 @@ def _extract_tools(module: ModuleType) -> List[Any]:
         if hasattr(module, attr_name):
             return _normalize_tools(getattr(module, attr_name))
 
+    # Scan the namespace directly: getmembers() sorts every attribute and
+    # re-fetches each one through getattr. Tools are returned in definition
+    # order.
     tools: List[Any] = []
-    for _, value in inspect.getmembers(module):
+    for value in list(vars(module).values()):
         if isinstance(value, list):
             continue
         if _looks_like_tool_instance(value):
             tools.append(value)
-        elif inspect.isclass(value) and value.__name__.endswith("Tools"):
+        elif isinstance(value, type) and value.__name__.endswith("Tools"):
             try:
                 tools.append(value())
             except Exception:
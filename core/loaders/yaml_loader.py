@@ -0,0 +1,26 @@
+"""YAML parsing and emitting through libyaml when PyYAML was built with it."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+
+def load_yaml(text: str) -> Any:
+    """Parse *text* like ``yaml.safe_load``, using the C loader if available."""
+
+    return yaml.load(text, Loader=_SafeLoader)
+
+
+def dump_yaml(data: Any, *, sort_keys: bool = False) -> str:
+    """Serialise *data* like ``yaml.safe_dump``, using the C dumper if available."""
+
+    return yaml.dump(data, Dumper=_SafeDumper, sort_keys=sort_keys)
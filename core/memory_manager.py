@@ -2,18 +2,51 @@
 
 from __future__ import annotations
 
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple, TypeVar
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, DateTime, Integer, String, Text, create_engine
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    String,
+    Text,
+    delete,
+    func,
+    select,
+)
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
-from db.url import get_db_url
+from db.engine import create_db_engine
 
 Base = declarative_base()
 
+T = TypeVar("T")
+
+# Sessions whose recent history is kept in process, least recently read
+# evicted first, and how long (seconds) a cached window may be served. Writes
+# through this manager update the window immediately; the TTL bounds
+# staleness from writes made by other processes.
+HISTORY_CACHE_SESSIONS = 10_000
+HISTORY_CACHE_TTL = 30.0
+# Most recent messages held per cached session; reads with a larger limit go
+# straight to the database.
+MAX_HISTORY = 200
+# Retired session windows kept for reuse, so recycling a session refills an
+# existing deque instead of allocating a new one.
+SESSION_POOL_SIZE = 1024
+# Sessions with a tracked write counter; past this the counters are reset
+# together, which only discards window loads in flight at that moment.
+HISTORY_VERSION_SESSIONS = 100_000
+
 
 class ChatMessage(Base):
     """Persistent chat message with session tracking."""
@@ -41,15 +74,127 @@ class SessionMemory(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
+@dataclass(slots=True)
+class SessionHistory:
+    """In-process window over a session's most recent messages.
+
+    Messages are stored column-wise in parallel ring buffers, so a cached
+    message costs one slot per field instead of a dict; dicts are built only
+    for the messages a read returns.
+    """
+
+    ids: Deque[str]
+    roles: Deque[str]
+    contents: Deque[str]
+    timestamps: Deque[str]
+    metadata: Deque[Optional[str]]
+    # True when the window holds the whole session, not just its newest rows.
+    complete: bool = False
+    expires_at: float = 0.0
+
+    @classmethod
+    def with_capacity(cls, size: int) -> SessionHistory:
+        return cls(*(deque(maxlen=size) for _ in range(5)))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def full(self) -> bool:
+        return len(self.ids) == self.ids.maxlen
+
+    def append(
+        self,
+        message_id: UUID,
+        role: str,
+        content: str,
+        timestamp: datetime,
+        metadata: Optional[str],
+    ) -> None:
+        """Add a message as the newest, dropping the oldest once full."""
+        self.ids.append(str(message_id))
+        # Sessions repeat a handful of roles; interning shares one string.
+        self.roles.append(sys.intern(role))
+        self.contents.append(content)
+        self.timestamps.append(timestamp.isoformat())
+        self.metadata.append(metadata)
+
+    def extend(self, rows: Iterable[Any]) -> None:
+        """Append ``(id, role, content, timestamp, metadata)`` rows, oldest first."""
+        for row in rows:
+            self.append(*row)
+
+    def clear(self) -> None:
+        for column in self._columns():
+            column.clear()
+
+    def tail(self, limit: int) -> Optional[List[dict]]:
+        """Return the newest *limit* messages, or None if the window is short."""
+        size = len(self)
+        if limit > size and not self.complete:
+            return None
+        return self._messages(max(size - limit, 0), size)
+
+    def page(self, cursor: int, limit: int) -> Optional[Tuple[List[dict], bool]]:
+        """Return the page starting *cursor* messages back from the newest.
+
+        The flag says whether older messages remain; None means the window is
+        too short to answer.
+        """
+        size = len(self)
+        end = cursor + limit
+        if end >= size and not self.complete:
+            return None
+        page = self._messages(max(size - end, 0), max(size - cursor, 0))
+        return page, end < size
+
+    def _columns(self) -> Tuple[Deque[Any], ...]:
+        return self.ids, self.roles, self.contents, self.timestamps, self.metadata
+
+    def _messages(self, start: int, stop: int) -> List[dict]:
+        columns = (islice(column, start, stop) for column in self._columns())
+        return [
+            {
+                "id": message_id,
+                "role": role,
+                "content": content,
+                "timestamp": timestamp,
+                "metadata": metadata,
+            }
+            for message_id, role, content, timestamp, metadata in zip(*columns)
+        ]
+
+
 class MemoryManager:
     """Manages persistent chat history and session memory."""
 
-    def __init__(self, database_url: Optional[str] = None) -> None:
-        url = database_url or get_db_url()
-        self.engine = create_engine(url, pool_pre_ping=True)
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        *,
+        history_cache_sessions: int = HISTORY_CACHE_SESSIONS,
+        history_cache_ttl: float = HISTORY_CACHE_TTL,
+        max_history: int = MAX_HISTORY,
+        **engine_options: Any,
+    ) -> None:
+        self.engine = create_db_engine(database_url, **engine_options)
         self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
         Base.metadata.create_all(self.engine)
 
+        self.history_cache_sessions = history_cache_sessions
+        self.history_cache_ttl = history_cache_ttl
+        self.max_history = max_history
+        self.history_cache_hits = 0
+        # session_id -> recent message window, oldest read first
+        self._history_cache: OrderedDict[str, SessionHistory] = OrderedDict()
+        self._history_pool: List[SessionHistory] = []
+        self._history_lock = threading.RLock()
+        # Per-session counters bumped by every write, so a read that raced a
+        # write to its session is not cached with the pre-write rows. The
+        # epoch is bumped when every session is invalidated at once.
+        self._history_versions: Dict[str, int] = {}
+        self._history_epoch = 0
+
     def add_message(
         self,
         session_id: str,
@@ -58,6 +203,11 @@ class MemoryManager:
         message_metadata: Optional[str] = None,
     ) -> UUID:
         """Store a chat message."""
+        # Invalidate loads already in flight: their version check fails even
+        # if they read the row once it is committed.
+        with self._history_lock:
+            self._bump_history_version(session_id)
+
         with self.SessionLocal() as session:
             message = ChatMessage(
                 session_id=session_id,
@@ -67,7 +217,21 @@ class MemoryManager:
             )
             session.add(message)
             session.commit()
-            return message.id
+
+        with self._history_lock:
+            self._bump_history_version(session_id)
+            cached = self._history_cache.get(session_id)
+            # A load that started after the first bump may already have
+            # cached the committed row.
+            if cached is not None and str(message.id) not in cached.ids:
+                # The ring buffer drops the oldest message once it is full,
+                # after which it no longer holds the whole session.
+                if cached.full:
+                    cached.complete = False
+                cached.append(
+                    message.id, role, content, message.timestamp, message_metadata
+                )
+        return message.id
 
     def get_chat_history(
         self,
@@ -75,24 +239,169 @@ class MemoryManager:
         limit: int = 50,
     ) -> List[dict]:
         """Retrieve recent chat messages for a session."""
+        cacheable = self.history_cache_sessions > 0 and limit <= self.max_history
+        if cacheable:
+            cached = self._read_cached(session_id, lambda window: window.tail(limit))
+            if cached is not None:
+                return cached
+
+        # Load the whole window once so later reads with any smaller limit
+        # are served from it.
+        if cacheable:
+            rows = self._load_window(session_id)
+        else:
+            rows = self._load_history(session_id, limit)
+        return [self._message_dict(*row) for row in reversed(rows[:limit])]
+
+    def _load_window(self, session_id: str) -> List[Any]:
+        """Load and cache the newest ``max_history`` rows, newest first."""
+        with self._history_lock:
+            version = self._history_version(session_id)
+        rows = self._load_history(session_id, self.max_history)
+        self._store_history(session_id, rows, len(rows) < self.max_history, version)
+        return rows
+
+    def _load_history(
+        self, session_id: str, limit: int, offset: int = 0
+    ) -> List[Any]:
+        # Select plain columns rather than ORM entities so rows skip identity
+        # map and attribute instrumentation.
+        stmt = (
+            select(
+                ChatMessage.id,
+                ChatMessage.role,
+                ChatMessage.content,
+                ChatMessage.timestamp,
+                ChatMessage.message_metadata,
+            )
+            .where(ChatMessage.session_id == session_id)
+            .order_by(ChatMessage.timestamp.desc())
+            .limit(limit)
+        )
+        if offset:
+            stmt = stmt.offset(offset)
         with self.SessionLocal() as session:
-            messages = (
-                session.query(ChatMessage)
-                .filter(ChatMessage.session_id == session_id)
-                .order_by(ChatMessage.timestamp.desc())
-                .limit(limit)
-                .all()
+            return session.execute(stmt).all()
+
+    @staticmethod
+    def _message_dict(
+        message_id: UUID,
+        role: str,
+        content: str,
+        timestamp: datetime,
+        metadata: Optional[str],
+    ) -> dict:
+        return {
+            "id": str(message_id),
+            "role": role,
+            "content": content,
+            "timestamp": timestamp.isoformat(),
+            "metadata": metadata,
+        }
+
+    def page_history(
+        self,
+        session_id: str,
+        cursor: int = 0,
+        limit: int = 50,
+    ) -> Tuple[List[dict], Optional[int]]:
+        """Retrieve one page of chat history, walking back from the newest.
+
+        *cursor* counts messages already seen from the newest end, so cursor 0
+        is the same page ``get_chat_history`` returns. Messages within a page
+        are oldest first. The second item is the cursor for the next older
+        page, or None once the first message has been returned.
+        """
+        end = cursor + limit
+        if self.history_cache_sessions > 0 and end < self.max_history:
+            cached = self._read_cached(
+                session_id, lambda window: window.page(cursor, limit)
             )
-            return [
-                {
-                    "id": str(msg.id),
-                    "role": msg.role,
-                    "content": msg.content,
-                    "timestamp": msg.timestamp.isoformat(),
-                    "metadata": msg.message_metadata,
-                }
-                for msg in reversed(messages)
-            ]
+            if cached is None:
+                # Load the window; it holds the whole session unless it is
+                # full, and a full window reaches past this page either way.
+                rows = self._load_window(session_id)
+                page = [self._message_dict(*row) for row in reversed(rows[cursor:end])]
+                cached = page, end < len(rows)
+            page, has_more = cached
+            return page, end if has_more else None
+
+        # One extra row says whether an older page exists.
+        rows = self._load_history(session_id, limit + 1, offset=cursor)
+        page = [self._message_dict(*row) for row in reversed(rows[:limit])]
+        return page, end if len(rows) > limit else None
+
+    def _read_cached(
+        self, session_id: str, read: Callable[[SessionHistory], Optional[T]]
+    ) -> Optional[T]:
+        with self._history_lock:
+            cached = self._history_cache.get(session_id)
+            if cached is None or cached.expires_at <= time.monotonic():
+                return None
+            result = read(cached)
+            if result is not None:
+                self._history_cache.move_to_end(session_id)
+                self.history_cache_hits += 1
+            return result
+
+    def _store_history(
+        self,
+        session_id: str,
+        rows: List[Any],
+        complete: bool,
+        version: Tuple[int, int],
+    ) -> None:
+        """Cache newest-first *rows* as the session's window."""
+        expires_at = time.monotonic() + self.history_cache_ttl
+        with self._history_lock:
+            if version != self._history_version(session_id):
+                return
+            if self._history_pool:
+                window = self._history_pool.pop()
+            else:
+                window = SessionHistory.with_capacity(self.max_history)
+            window.extend(reversed(rows))
+            window.complete = complete
+            window.expires_at = expires_at
+            previous = self._history_cache.pop(session_id, None)
+            if previous is not None:
+                self._release_window(previous)
+            self._history_cache[session_id] = window
+            while len(self._history_cache) > self.history_cache_sessions:
+                self._release_window(self._history_cache.popitem(last=False)[1])
+
+    def _release_window(self, window: SessionHistory) -> None:
+        # Called with the history lock held. Windows are only read under that
+        # lock, so nothing else still references one once it is uncached.
+        if len(self._history_pool) < SESSION_POOL_SIZE:
+            window.clear()
+            self._history_pool.append(window)
+
+    def _history_version(self, session_id: str) -> Tuple[int, int]:
+        # Called with the history lock held.
+        return self._history_epoch, self._history_versions.get(session_id, 0)
+
+    def _bump_history_version(self, session_id: str) -> None:
+        # Called with the history lock held.
+        versions = self._history_versions
+        if session_id not in versions and len(versions) >= HISTORY_VERSION_SESSIONS:
+            self._history_epoch += 1
+            versions.clear()
+        versions[session_id] = versions.get(session_id, 0) + 1
+
+    def _invalidate_history(self, session_id: Optional[str] = None) -> None:
+        """Drop cached history for *session_id*, or for every session."""
+        with self._history_lock:
+            if session_id is None:
+                self._history_epoch += 1
+                self._history_versions.clear()
+                while self._history_cache:
+                    self._release_window(self._history_cache.popitem()[1])
+            else:
+                self._bump_history_version(session_id)
+                window = self._history_cache.pop(session_id, None)
+                if window is not None:
+                    self._release_window(window)
 
     def initialize_session(
         self,
@@ -143,14 +452,23 @@ class MemoryManager:
 
     def clear_session(self, session_id: str) -> None:
         """Delete all messages and memory for a session."""
+        # Both deletes run as one statement: the message delete is attached
+        # as a data-modifying CTE of the session delete.
+        deleted_messages = (
+            delete(ChatMessage)
+            .where(ChatMessage.session_id == session_id)
+            .returning(ChatMessage.id)
+            .cte("deleted_messages")
+        )
+        stmt = (
+            delete(SessionMemory)
+            .where(SessionMemory.session_id == session_id)
+            .add_cte(deleted_messages)
+        )
         with self.SessionLocal() as session:
-            session.query(ChatMessage).filter(
-                ChatMessage.session_id == session_id
-            ).delete()
-            session.query(SessionMemory).filter(
-                SessionMemory.session_id == session_id
-            ).delete()
+            session.execute(stmt)
             session.commit()
+        self._invalidate_history(session_id)
 
     def list_sessions(
         self,
@@ -196,14 +514,18 @@ class MemoryManager:
 
     def get_stats(self) -> dict:
         """Get memory statistics across all sessions."""
+        # One round trip: count(learned_facts) skips NULLs, so the session
+        # totals share a single scan of session_memory.
+        message_count = select(func.count()).select_from(ChatMessage).scalar_subquery()
+        stmt = select(
+            func.count(SessionMemory.id),
+            func.count(SessionMemory.learned_facts),
+            message_count,
+        )
         with self.SessionLocal() as session:
-            total_sessions = session.query(SessionMemory).count()
-            total_messages = session.query(ChatMessage).count()
-            sessions_with_facts = (
-                session.query(SessionMemory)
-                .filter(SessionMemory.learned_facts.isnot(None))
-                .count()
-            )
+            total_sessions, sessions_with_facts, total_messages = session.execute(
+                stmt
+            ).one()
 
             return {
                 "total_sessions": total_sessions,
@@ -217,11 +539,11 @@ class MemoryManager:
     def clear_all_sessions(self) -> int:
         """Delete all sessions and messages."""
         with self.SessionLocal() as session:
-            count = session.query(SessionMemory).count()
-            session.query(ChatMessage).delete()
-            session.query(SessionMemory).delete()
+            count = session.execute(delete(SessionMemory)).rowcount
+            session.execute(delete(ChatMessage))
             session.commit()
-            return count
+        self._invalidate_history()
+        return count
 
     def search_messages(
         self,
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import math
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional
 
+import numpy as np
 from agno.run.agent import RunOutput
 
 
@@ -22,6 +25,28 @@ class ValidationStatus(str, Enum):
     PARTIAL = "partial"
 
 
+# Stable small-integer codes for the status column.
+_STATUSES = tuple(ValidationStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+_INITIAL_CAPACITY = 256
+MAX_HISTORY = 10_000
+
+# Log-spaced duration histogram: 64 buckets per doubling (~1% resolution).
+_HIST_BUCKETS = 2048
+_HIST_BUCKETS_PER_DOUBLING = 64
+
+
+def _duration_bucket(duration_ms: float) -> int:
+    return min(
+        _HIST_BUCKETS - 1,
+        int(math.log2(max(duration_ms, 0.0) + 1) * _HIST_BUCKETS_PER_DOUBLING),
+    )
+
+
+def _bucket_midpoint(bucket: int) -> float:
+    return 2 ** ((bucket + 0.5) / _HIST_BUCKETS_PER_DOUBLING) - 1
+
+
 class MetricType(str, Enum):
     """Types of metrics tracked."""
 
@@ -31,12 +56,12 @@ class MetricType(str, Enum):
     LATENCY = "latency"
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Performance metrics for a single operation."""
 
-    start_time: float = field(default_factory=time.time)
-    end_time: Optional[float] = None
+    start_time_ns: int = field(default_factory=time.monotonic_ns)
+    end_time_ns: Optional[int] = None
     duration_ms: Optional[float] = None
     token_count: Optional[int] = None
     model_name: Optional[str] = None
@@ -45,75 +70,157 @@ class PerformanceMetrics:
 
     def end(self) -> None:
         """Mark the end of the operation and calculate duration."""
-        self.end_time = time.time()
-        self.duration_ms = (self.end_time - self.start_time) * 1000
+        self.end_time_ns = time.monotonic_ns()
+        self.duration_ms = (self.end_time_ns - self.start_time_ns) / 1e6
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationMetrics:
-    """Validation and hallucination detection metrics."""
+    """Validation and hallucination detection metrics.
+
+    Claims and reasoning steps are only ever reported as counts, so they are
+    stored as counters rather than lists of strings.
+    """
 
     status: ValidationStatus = ValidationStatus.UNVERIFIED
     confidence_score: float = 0.0
     validation_checks: Dict[str, bool] = field(default_factory=dict)
     evidence_count: int = 0
-    factual_claims: List[str] = field(default_factory=list)
-    verified_claims: List[str] = field(default_factory=list)
+    factual_claims_count: int = 0
+    verified_claims_count: int = 0
     hallucination_indicators: List[str] = field(default_factory=list)
     source_references: List[str] = field(default_factory=list)
-    reasoning_steps: List[str] = field(default_factory=list)
+    reasoning_steps_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionMetrics:
     """Complete metrics for an agent execution."""
 
     execution_id: str
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    created_ns: int = field(default_factory=time.time_ns)
     performance: PerformanceMetrics = field(default_factory=PerformanceMetrics)
     validation: ValidationMetrics = field(default_factory=ValidationMetrics)
     input_text: Optional[str] = None
     output_text: Optional[str] = None
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Recorded by ``freeze`` once the texts are final; ``to_dict`` measures
+    # the texts directly, so in-flight executions report their lengths too.
+    input_length: int = field(default=0, init=False)
+    output_length: int = field(default=0, init=False)
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time (UTC), materialized from ``created_ns`` on demand."""
+        return datetime.fromtimestamp(self.created_ns / 1e9, tz=timezone.utc)
+
+    def freeze(self) -> None:
+        """Snapshot the serialized form once the execution has completed.
+
+        After freezing, ``to_dict`` returns the snapshot; the execution is
+        not expected to change any further.
+        """
+        self.input_length = len(self.input_text or "")
+        self.output_length = len(self.output_text or "")
+        self._dict_cache = self._build_dict()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
+        if self._dict_cache is not None:
+            return self._dict_cache
+        return self._build_dict()
+
+    def _build_dict(self) -> Dict[str, Any]:
+        performance = self.performance
+        validation = self.validation
         return {
             "execution_id": self.execution_id,
             "timestamp": self.timestamp.isoformat(),
             "performance": {
-                "duration_ms": self.performance.duration_ms,
-                "token_count": self.performance.token_count,
-                "model_name": self.performance.model_name,
-                "skill_name": self.performance.skill_name,
-                "agent_name": self.performance.agent_name,
+                "duration_ms": performance.duration_ms,
+                "token_count": performance.token_count,
+                "model_name": performance.model_name,
+                "skill_name": performance.skill_name,
+                "agent_name": performance.agent_name,
             },
             "validation": {
-                "status": self.validation.status.value,
-                "confidence_score": self.validation.confidence_score,
-                "validation_checks": self.validation.validation_checks,
-                "evidence_count": self.validation.evidence_count,
-                "factual_claims_count": len(self.validation.factual_claims),
-                "verified_claims_count": len(self.validation.verified_claims),
-                "hallucination_indicators": self.validation.hallucination_indicators,
-                "source_references": self.validation.source_references,
-                "reasoning_steps_count": len(self.validation.reasoning_steps),
+                "status": validation.status.value,
+                "confidence_score": validation.confidence_score,
+                "validation_checks": validation.validation_checks,
+                "evidence_count": validation.evidence_count,
+                "factual_claims_count": validation.factual_claims_count,
+                "verified_claims_count": validation.verified_claims_count,
+                "hallucination_indicators": validation.hallucination_indicators,
+                "source_references": validation.source_references,
+                "reasoning_steps_count": validation.reasoning_steps_count,
             },
-            "input_length": len(self.input_text) if self.input_text else 0,
-            "output_length": len(self.output_text) if self.output_text else 0,
+            "input_length": len(self.input_text or ""),
+            "output_length": len(self.output_text or ""),
             "error": self.error,
             "metadata": self.metadata,
         }
 
 
 class MetricsCollector:
-    """Centralized metrics collection and aggregation."""
-
-    def __init__(self) -> None:
-        self._metrics: List[ExecutionMetrics] = []
+    """Centralized metrics collection and aggregation.
+
+    Alongside the ``ExecutionMetrics`` objects, the collector keeps one numpy
+    column per aggregated field (duration, confidence, status code). Rows are
+    written by :meth:`finalize` once an execution completes, which also
+    records the row under its agent name and status in secondary indexes, so
+    filtering and per-agent statistics touch only matching rows.
+
+    Collector-wide statistics go further: ``finalize`` also folds each
+    execution into running totals and a log-bucketed duration histogram, so
+    ``get_aggregated_stats`` costs the same regardless of history size.
+    Percentiles are read from the histogram and are accurate to about 1%.
+
+    Only the most recent ``max_history`` executions are retained; rows are
+    numbered by a running sequence and the columns act as a ring buffer.
+    Collector-wide statistics still cover every execution, while listings and
+    per-agent statistics cover the retained window.
+    """
+
+    def __init__(self, max_history: int = MAX_HISTORY) -> None:
+        self._max_history = max_history
+        self._metrics: Deque[ExecutionMetrics] = deque(maxlen=max_history)
         self._aggregates: Dict[str, Dict[str, Any]] = defaultdict(dict)
         self._execution_count = 0
+        self._pending_rows: Dict[str, int] = {}
+        self._by_agent: Dict[str, Deque[int]] = defaultdict(deque)
+        self._by_status: Dict[str, Deque[int]] = defaultdict(deque)
+        self._allocate_columns(min(_INITIAL_CAPACITY, max_history))
+        self._reset_running_stats()
+
+    def _reset_running_stats(self) -> None:
+        self._dur_count = 0
+        self._dur_sum = 0.0
+        self._dur_min = math.inf
+        self._dur_max = -math.inf
+        self._dur_hist = np.zeros(_HIST_BUCKETS, dtype=np.int64)
+        self._status_totals = np.zeros(len(_STATUSES), dtype=np.int64)
+        self._confidence_sum = 0.0
+
+    def _allocate_columns(self, capacity: int) -> None:
+        self._durations = np.full(capacity, np.nan, dtype=np.float64)
+        self._confidence = np.zeros(capacity, dtype=np.float64)
+        self._status_codes = np.full(
+            capacity, _STATUS_CODES[ValidationStatus.UNVERIFIED], dtype=np.uint8
+        )
+
+    def _grow_columns(self) -> None:
+        """Double column capacity (up to ``max_history``), keeping the rows."""
+        size = len(self._durations)
+        old = (self._durations, self._confidence, self._status_codes)
+        self._allocate_columns(min(size * 2, self._max_history))
+        for column, previous in zip(
+            (self._durations, self._confidence, self._status_codes), old
+        ):
+            column[:size] = previous
 
     def create_execution(self, execution_id: str, **metadata: Any) -> ExecutionMetrics:
         """Create a new execution metrics tracker."""
@@ -121,132 +228,199 @@ class MetricsCollector:
             execution_id=execution_id,
             metadata=metadata,
         )
+        if len(self._metrics) == self._max_history:
+            # The oldest execution is about to be dropped; if it never
+            # finished, count it as it stands so the totals stay complete.
+            evicted = self._metrics[0]
+            if self._pending_rows.pop(evicted.execution_id, None) is not None:
+                self._accumulate(evicted)
+
+        row = self._execution_count
+        if row % self._max_history == len(self._durations):
+            self._grow_columns()
+        self._pending_rows[execution_id] = row
         self._metrics.append(execution)
         self._execution_count += 1
         return execution
 
+    @property
+    def _oldest_row(self) -> int:
+        return self._execution_count - len(self._metrics)
+
+    def finalize(self, execution: ExecutionMetrics) -> None:
+        """Record a completed execution in the columns and running totals.
+
+        Each execution is finalized (and frozen) once; repeated calls are
+        ignored.
+        """
+        row = self._pending_rows.pop(execution.execution_id, None)
+        if row is None:
+            return
+        execution.freeze()
+
+        oldest = self._oldest_row
+        if row >= oldest:
+            slot = row % self._max_history
+            duration = execution.performance.duration_ms
+            self._durations[slot] = np.nan if duration is None else duration
+            self._confidence[slot] = execution.validation.confidence_score
+            self._status_codes[slot] = _STATUS_CODES[execution.validation.status]
+            status_index = self._by_status[execution.validation.status.value]
+            self._index_row(status_index, row, oldest)
+            agent_name = execution.performance.agent_name
+            if agent_name is not None:
+                self._index_row(self._by_agent[agent_name], row, oldest)
+
+        self._accumulate(execution)
+
+    @staticmethod
+    def _index_row(index: Deque[int], row: int, oldest: int) -> None:
+        while index and index[0] < oldest:
+            index.popleft()
+        index.append(row)
+
+    def _accumulate(self, execution: ExecutionMetrics) -> None:
+        """Fold an execution into the collector-wide running totals."""
+        duration = execution.performance.duration_ms
+        confidence = execution.validation.confidence_score
+        status_code = _STATUS_CODES[execution.validation.status]
+        self._status_totals[status_code] += 1
+        self._confidence_sum += confidence
+        if duration is not None:
+            self._dur_count += 1
+            self._dur_sum += duration
+            self._dur_min = min(self._dur_min, duration)
+            self._dur_max = max(self._dur_max, duration)
+            self._dur_hist[_duration_bucket(duration)] += 1
+
+    def _duration_percentile(self, rank: int) -> float:
+        """Estimate the duration at 0-based *rank* in sorted order."""
+        bucket = int(np.searchsorted(np.cumsum(self._dur_hist), rank, side="right"))
+        return min(max(_bucket_midpoint(bucket), self._dur_min), self._dur_max)
+
     def get_metrics(
         self,
         limit: int = 100,
         filter_by: Optional[Dict[str, Any]] = None,
     ) -> List[ExecutionMetrics]:
         """Get collected metrics with optional filtering."""
-        metrics = self._metrics[-limit:]
-
-        if filter_by:
-            filtered = []
-            for m in metrics:
-                match = True
-                for key, value in filter_by.items():
-                    if key == "status":
-                        if m.validation.status != value:
-                            match = False
-                            break
-                    elif key == "agent_name":
-                        if m.performance.agent_name != value:
-                            match = False
-                            break
-                if match:
-                    filtered.append(m)
-            return filtered
-
-        return metrics
+        retained = len(self._metrics)
+        window = retained - slice(-limit, None).indices(retained)[0]
+        if not filter_by:
+            return self._recent(window)
+
+        oldest = self._oldest_row
+        start = oldest + retained - window
+        rows: Optional[set[int]] = None
+        for key, value in filter_by.items():
+            if key == "status":
+                index = self._by_status.get(getattr(value, "value", value), ())
+            elif key == "agent_name":
+                index = self._by_agent.get(value, ())
+            else:
+                continue
+            matched = {row for row in index if row >= start}
+            rows = matched if rows is None else rows & matched
+
+        # Executions still in flight are not indexed yet; match them directly.
+        pending = [
+            row
+            for row in self._pending_rows.values()
+            if row >= start and self._matches(self._metrics[row - oldest], filter_by)
+        ]
+        if rows is None:
+            return self._recent(window)
+        return [self._metrics[row - oldest] for row in sorted(rows.union(pending))]
+
+    def _recent(self, count: int) -> List[ExecutionMetrics]:
+        """The newest *count* executions, oldest first, without a full copy."""
+        recent = list(islice(reversed(self._metrics), count))
+        recent.reverse()
+        return recent
+
+    @staticmethod
+    def _matches(execution: ExecutionMetrics, filter_by: Dict[str, Any]) -> bool:
+        for key, value in filter_by.items():
+            if key == "status" and execution.validation.status != value:
+                return False
+            if key == "agent_name" and execution.performance.agent_name != value:
+                return False
+        return True
 
     def get_aggregated_stats(self) -> Dict[str, Any]:
         """Calculate aggregated statistics across all metrics."""
-        if not self._metrics:
+        if not self._execution_count:
             return self._get_empty_stats()
 
-        total = len(self._metrics)
-        valid_durations = [
-            m.performance.duration_ms
-            for m in self._metrics
-            if m.performance.duration_ms is not None
-        ]
+        total = self._execution_count
+        # Executions that have not been finalized yet still count as unverified.
+        counts = self._status_totals.copy()
+        counts[_STATUS_CODES[ValidationStatus.UNVERIFIED]] += len(self._pending_rows)
+        validation_counts = {
+            _STATUSES[code].value: int(count)
+            for code, count in enumerate(counts)
+            if count
+        }
 
-        validation_counts = defaultdict(int)
-        for m in self._metrics:
-            validation_counts[m.validation.status.value] += 1
+        def percentage(status: ValidationStatus) -> float:
+            return validation_counts.get(status.value, 0) / total * 100
 
-        avg_confidence = (
-            sum(m.validation.confidence_score for m in self._metrics) / total
-        )
+        performance: Dict[str, float] = {
+            "avg_duration_ms": 0,
+            "min_duration_ms": 0,
+            "max_duration_ms": 0,
+            "p50_duration_ms": 0,
+            "p95_duration_ms": 0,
+        }
+        if self._dur_count:
+            performance = {
+                "avg_duration_ms": self._dur_sum / self._dur_count,
+                "min_duration_ms": self._dur_min,
+                "max_duration_ms": self._dur_max,
+                "p50_duration_ms": self._duration_percentile(self._dur_count // 2),
+                "p95_duration_ms": self._duration_percentile(
+                    int(self._dur_count * 0.95)
+                ),
+            }
 
         return {
             "total_executions": total,
-            "performance": {
-                "avg_duration_ms": (
-                    sum(valid_durations) / len(valid_durations)
-                    if valid_durations
-                    else 0
-                ),
-                "min_duration_ms": min(valid_durations) if valid_durations else 0,
-                "max_duration_ms": max(valid_durations) if valid_durations else 0,
-                "p50_duration_ms": (
-                    sorted(valid_durations)[len(valid_durations) // 2]
-                    if valid_durations
-                    else 0
-                ),
-                "p95_duration_ms": (
-                    sorted(valid_durations)[int(len(valid_durations) * 0.95)]
-                    if valid_durations
-                    else 0
-                ),
-            },
+            "performance": performance,
             "validation": {
-                "status_counts": dict(validation_counts),
-                "avg_confidence_score": avg_confidence,
-                "valid_percentage": (
-                    validation_counts[ValidationStatus.VALID.value] / total * 100
-                    if total > 0
-                    else 0
-                ),
-                "hallucination_percentage": (
-                    validation_counts[ValidationStatus.HALLUCINATION.value]
-                    / total
-                    * 100
-                    if total > 0
-                    else 0
-                ),
-                "invalid_percentage": (
-                    validation_counts[ValidationStatus.INVALID.value] / total * 100
-                    if total > 0
-                    else 0
-                ),
+                "status_counts": validation_counts,
+                "avg_confidence_score": self._confidence_sum / total,
+                "valid_percentage": percentage(ValidationStatus.VALID),
+                "hallucination_percentage": percentage(ValidationStatus.HALLUCINATION),
+                "invalid_percentage": percentage(ValidationStatus.INVALID),
             },
-            "recent_executions": [m.to_dict() for m in self._metrics[-10:]],
+            "recent_executions": [m.to_dict() for m in self._recent(10)],
         }
 
     def get_agent_stats(self, agent_name: str) -> Dict[str, Any]:
         """Get statistics for a specific agent."""
-        agent_metrics = [
-            m for m in self._metrics if m.performance.agent_name == agent_name
-        ]
-
-        if not agent_metrics:
+        oldest = self._oldest_row
+        rows = [row for row in self._by_agent.get(agent_name, ()) if row >= oldest]
+        if not rows:
             return self._get_empty_stats()
 
-        total = len(agent_metrics)
-        valid_durations = [
-            m.performance.duration_ms
-            for m in agent_metrics
-            if m.performance.duration_ms is not None
-        ]
-
-        validation_counts = defaultdict(int)
-        for m in agent_metrics:
-            validation_counts[m.validation.status.value] += 1
+        positions = np.array(rows, dtype=np.intp) % self._max_history
+        total = len(rows)
+        durations = self._durations[positions]
+        valid_durations = durations[~np.isnan(durations)]
+        counts = np.bincount(self._status_codes[positions], minlength=len(_STATUSES))
 
         return {
             "agent_name": agent_name,
             "total_executions": total,
             "avg_duration_ms": (
-                sum(valid_durations) / len(valid_durations) if valid_durations else 0
-            ),
-            "validation_stats": dict(validation_counts),
-            "avg_confidence": (
-                sum(m.validation.confidence_score for m in agent_metrics) / total
+                float(valid_durations.mean()) if valid_durations.size else 0
             ),
+            "validation_stats": {
+                _STATUSES[code].value: int(count)
+                for code, count in enumerate(counts)
+                if count
+            },
+            "avg_confidence": float(self._confidence[positions].mean()),
         }
 
     def clear(self) -> None:
@@ -254,6 +428,11 @@ class MetricsCollector:
         self._metrics.clear()
         self._aggregates.clear()
         self._execution_count = 0
+        self._pending_rows.clear()
+        self._by_agent.clear()
+        self._by_status.clear()
+        self._allocate_columns(min(_INITIAL_CAPACITY, self._max_history))
+        self._reset_running_stats()
 
     def _get_empty_stats(self) -> Dict[str, Any]:
         """Return empty statistics structure."""
@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence
-
-import yaml
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from .loaders.tool_loader import load_tools_from_dir
+from .loaders.yaml_loader import load_yaml
 from .skills import AgentContext, SkillMetadata, SkillRegistry, SkillRouter
 
+# Shared assets are the same for every orchestrator pointing at the same
+# paths, so loads are cached per path and tagged with the on-disk state
+# they were read from; a changed stamp triggers a fresh load.
+_SHARED_PROMPT_CACHE: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+_SHARED_TOOLS_CACHE: Dict[Path, Tuple[Tuple[Any, ...], List[object]]] = {}
+
+# Resolves an agent's skill ids from (message, fallback_skill_ids).
+SkillPlan = Callable[[Optional[str], Optional[Iterable[str]]], Optional[List[str]]]
+
 
 class SkillOrchestrator:
     """Aggregate shared prompts, tools, and skill packages on demand."""
@@ -28,7 +38,14 @@ class SkillOrchestrator:
         self._shared_tools_cache: Optional[List[object]] = None
         self._config_path = config_path
         self._config_cache: Optional[Dict[str, Any]] = None
+        self._skill_plans: Dict[str, SkillPlan] = {}
+        # Last parsed config with its (st_mtime_ns, st_size), so reloading an
+        # unchanged file skips the YAML parse.
+        self._parsed_config: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
         self._router: Optional[SkillRouter] = None
+        # Assembled contexts keyed by their inputs and the registry revision;
+        # shared asset reloads clear it.
+        self._assemble_cached = lru_cache(maxsize=256)(self._assemble)
 
     @property
     def registry(self) -> SkillRegistry:
@@ -52,10 +69,11 @@ class SkillOrchestrator:
         config = self._load_config()
         agent_config = config.get("agents", {}).get(agent_id, {})
 
-        skills_config = agent_config.get("skills")
-        skill_ids = self._resolve_skill_ids(
-            skills_config, message=message, fallback_skill_ids=fallback_skill_ids
-        )
+        plan = self._skill_plans.get(agent_id)
+        if plan is None:
+            plan = self._compile_skill_plan(agent_config.get("skills"))
+            self._skill_plans[agent_id] = plan
+        skill_ids = plan(message, fallback_skill_ids)
 
         include_shared_flag = agent_config.get("include_shared")
         resolved_include_shared = (
@@ -112,6 +130,36 @@ class SkillOrchestrator:
         extra_tools: Iterable[object] | None = None,
         include_shared: bool = True,
     ) -> AgentContext:
+        instructions, tools, references, skills = self._assemble_cached(
+            tuple(skill_ids) if skill_ids else (),
+            extra_instructions,
+            include_shared,
+            self._registry.revision,
+        )
+
+        collected_tools = list(tools)
+        if extra_tools:
+            collected_tools.extend(extra_tools)
+        collected_references = list(references)
+
+        # Bind collected references to search tool for agentic RAG. Shared
+        # tools are rebound by other contexts, so this runs on cache hits too.
+        self._bind_references_to_tools(collected_tools, collected_references)
+
+        return AgentContext(
+            instructions=instructions,
+            tools=collected_tools,
+            references=collected_references,
+            skills=list(skills),
+        )
+
+    def _assemble(
+        self,
+        skill_ids: Tuple[str, ...],
+        extra_instructions: str | None,
+        include_shared: bool,
+        revision: int,
+    ) -> Tuple[str, Tuple[object, ...], Tuple[Path, ...], Tuple[SkillMetadata, ...]]:
         instructions_parts: List[str] = []
         collected_tools: List[object] = []
         collected_references: List[Path] = []
@@ -122,38 +170,28 @@ class SkillOrchestrator:
             if shared_prompt:
                 instructions_parts.append(shared_prompt)
             collected_tools.extend(self._load_shared_tools())
-            # Bind collected references to search tool for agentic RAG
-            self._bind_references_to_tools(collected_tools, collected_references)
-
-        if skill_ids:
-            for skill_id in skill_ids:
-                package = self._registry.load_skill(skill_id)
-                loaded_skills.append(package.metadata)
-                if package.instructions:
-                    instructions_parts.append(package.instructions)
-                if package.tools:
-                    collected_tools.extend(package.tools)
-                if package.references:
-                    collected_references.extend(package.references)
+
+        for skill_id in skill_ids:
+            package = self._registry.load_skill(skill_id)
+            loaded_skills.append(package.metadata)
+            if package.instructions:
+                instructions_parts.append(package.instructions)
+            if package.tools:
+                collected_tools.extend(package.tools)
+            if package.references:
+                collected_references.extend(package.references)
 
         if extra_instructions:
             cleaned = extra_instructions.strip()
             if cleaned:
                 instructions_parts.append(cleaned)
 
-        if extra_tools:
-            collected_tools.extend(extra_tools)
-
-        # Final reference binding after all tools collected
-        self._bind_references_to_tools(collected_tools, collected_references)
-
         instructions = "\n\n".join(part for part in instructions_parts if part).strip()
-
-        return AgentContext(
-            instructions=instructions,
-            tools=collected_tools,
-            references=collected_references,
-            skills=loaded_skills,
+        return (
+            instructions,
+            tuple(collected_tools),
+            tuple(collected_references),
+            tuple(loaded_skills),
         )
 
     def reload_config(self) -> None:
@@ -161,6 +199,7 @@ class SkillOrchestrator:
 
         self.reload_shared_assets()
         self._config_cache = None
+        self._skill_plans.clear()
         self._router = None
         self._registry.reload()
 
@@ -169,6 +208,7 @@ class SkillOrchestrator:
 
         self._shared_prompt_cache = None
         self._shared_tools_cache = None
+        self._assemble_cached.cache_clear()
 
     def route_skills(
         self,
@@ -181,42 +221,55 @@ class SkillOrchestrator:
         router = self._ensure_router()
         return router.route(message, limit=limit, tags=tags, min_score=min_score)
 
+    def route_skills_batch(
+        self,
+        messages: Sequence[str],
+        *,
+        limit: int | None = None,
+        tags: Iterable[str] | None = None,
+        min_score: float = 0.0,
+    ) -> List[List[SkillMetadata]]:
+        router = self._ensure_router()
+        return router.route_batch(
+            messages, limit=limit, tags=tags, min_score=min_score
+        )
+
     def _load_shared_prompt(self) -> str:
         if not self._shared_prompt_path:
             return ""
         if self._shared_prompt_cache is None:
-            if self._shared_prompt_path.exists():
-                self._shared_prompt_cache = self._shared_prompt_path.read_text(
-                    encoding="utf-8"
-                ).strip()
-            else:
-                self._shared_prompt_cache = ""
+            self._shared_prompt_cache = _read_shared_prompt(self._shared_prompt_path)
         return self._shared_prompt_cache
 
     def _load_shared_tools(self) -> List[object]:
         if not self._shared_tools_path:
             return []
         if self._shared_tools_cache is None:
-            self._shared_tools_cache = load_tools_from_dir(self._shared_tools_path)
+            self._shared_tools_cache = _load_shared_tools_dir(self._shared_tools_path)
         return list(self._shared_tools_cache)
 
     def _load_config(self) -> Dict[str, Any]:
         if not self._config_path:
             return {}
         if self._config_cache is None:
-            if self._config_path.exists():
-                data = (
-                    yaml.safe_load(self._config_path.read_text(encoding="utf-8")) or {}
-                )
-                if not isinstance(data, dict):
-                    raise ValueError(
-                        "skills_config.yaml must contain a mapping at the root"
-                    )
-                self._config_cache = data
-            else:
-                self._config_cache = {}
+            self._config_cache = self._read_config(self._config_path)
         return self._config_cache
 
+    def _read_config(self, config_path: Path) -> Dict[str, Any]:
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            return {}
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._parsed_config is not None and self._parsed_config[0] == stamp:
+            return self._parsed_config[1]
+
+        data = load_yaml(config_path.read_text(encoding="utf-8")) or {}
+        if not isinstance(data, dict):
+            raise ValueError("skills_config.yaml must contain a mapping at the root")
+        self._parsed_config = (stamp, data)
+        return data
+
     def _ensure_router(self) -> SkillRouter:
         if self._router is None:
             self._router = SkillRouter(self._registry)
@@ -225,66 +278,133 @@ class SkillOrchestrator:
     def _bind_references_to_tools(
         self, tools: List[object], references: List[Path]
     ) -> None:
-        """Inject reference paths into search_skill_references tool for agentic RAG."""
+        """Inject reference paths into search_skill_references tool for agentic RAG.
+
+        Tools are shared across contexts, so the undecorated entrypoint is kept
+        on the tool and every binding wraps that original, never a previous
+        wrapper. Rebinding is skipped when the references are unchanged.
+        """
         for tool in tools:
             if hasattr(tool, "name") and tool.name == "search_skill_references":
-                # Bind references to tool parameters for runtime access
-                if hasattr(tool, "entrypoint") and callable(tool.entrypoint):
+                original_fn = getattr(tool, "_original_entrypoint", None)
+                if original_fn is None:
+                    if not (hasattr(tool, "entrypoint") and callable(tool.entrypoint)):
+                        break
                     original_fn = tool.entrypoint
+                    tool._original_entrypoint = original_fn
+                bound = tuple(references)
+                if getattr(tool, "_bound_references", None) != bound:
+                    tool.entrypoint = _with_references(original_fn, references)
+                    tool._bound_references = bound
+                break
 
-                    def wrapped_fn(agent, query: str) -> str:
-                        return original_fn(agent, query, skill_references=references)
+    def _compile_skill_plan(self, skills_config: Any) -> SkillPlan:
+        """Pre-digest an agent's ``skills`` config into a resolver.
 
-                    tool.entrypoint = wrapped_fn
-                break
+        The config shape is inspected once; each call then only does the work
+        that depends on the message and fallback ids.
+        """
 
-    def _resolve_skill_ids(
-        self,
-        skills_config: Any,
-        *,
-        message: str | None,
-        fallback_skill_ids: Iterable[str] | None,
-    ) -> List[str] | None:
-        skill_ids: List[str] = []
+        def with_fallback(
+            skill_ids: List[str], fallback_skill_ids: Iterable[str] | None
+        ) -> List[str] | None:
+            if not skill_ids and fallback_skill_ids is not None:
+                skill_ids.extend(str(skill_id) for skill_id in fallback_skill_ids)
+            return skill_ids or None
 
         if isinstance(skills_config, (list, tuple)):
-            skill_ids.extend(str(skill_id) for skill_id in skills_config)
-        elif isinstance(skills_config, dict):
-            defaults = skills_config.get("default") or []
-            skill_ids.extend(str(skill_id) for skill_id in defaults)
+            static_ids = [str(skill_id) for skill_id in skills_config]
+            return lambda message, fallback: with_fallback(list(static_ids), fallback)
 
+        if isinstance(skills_config, dict):
+            defaults = [
+                str(skill_id) for skill_id in skills_config.get("default") or []
+            ]
             auto_cfg = skills_config.get("auto") or {}
-            if auto_cfg and message:
-                if isinstance(auto_cfg, dict) and auto_cfg.get("enabled", True):
-                    limit = auto_cfg.get("limit")
-                    limit_value = int(limit) if isinstance(limit, int) else None
-                    tags = auto_cfg.get("tags")
-                    min_score = float(auto_cfg.get("min_score", 0.0))
-                    routed = self.route_skills(
-                        message,
-                        limit=limit_value,
-                        tags=tags,
-                        min_score=min_score,
-                    )
-                    for metadata in routed:
-                        if metadata.id not in skill_ids:
-                            skill_ids.append(metadata.id)
+            route_options: Dict[str, Any] | None = None
+            auto_enabled = isinstance(auto_cfg, dict) and auto_cfg.get("enabled", True)
+            if auto_cfg and auto_enabled:
+                limit = auto_cfg.get("limit")
+                route_options = {
+                    "limit": int(limit) if isinstance(limit, int) else None,
+                    "tags": auto_cfg.get("tags"),
+                    "min_score": float(auto_cfg.get("min_score", 0.0)),
+                }
             additional = (
                 auto_cfg.get("additional") if isinstance(auto_cfg, dict) else None
-            )
-            if additional:
+            ) or []
+
+            def resolve(
+                message: str | None, fallback_skill_ids: Iterable[str] | None
+            ) -> List[str] | None:
+                skill_ids = list(defaults)
+                if route_options is not None and message:
+                    for metadata in self.route_skills(message, **route_options):
+                        if metadata.id not in skill_ids:
+                            skill_ids.append(metadata.id)
                 for skill_id in additional:
                     if skill_id and skill_id not in skill_ids:
                         skill_ids.append(str(skill_id))
-        elif (
-            isinstance(skills_config, str)
-            and skills_config.lower() == "auto"
-            and message
-        ):
-            routed = self.route_skills(message)
-            skill_ids.extend(metadata.id for metadata in routed)
-
-        if not skill_ids and fallback_skill_ids is not None:
-            skill_ids.extend(str(skill_id) for skill_id in fallback_skill_ids)
-
-        return skill_ids or None
+                return with_fallback(skill_ids, fallback_skill_ids)
+
+            return resolve
+
+        if isinstance(skills_config, str) and skills_config.lower() == "auto":
+
+            def resolve_auto(
+                message: str | None, fallback_skill_ids: Iterable[str] | None
+            ) -> List[str] | None:
+                skill_ids = (
+                    [metadata.id for metadata in self.route_skills(message)]
+                    if message
+                    else []
+                )
+                return with_fallback(skill_ids, fallback_skill_ids)
+
+            return resolve_auto
+
+        return lambda message, fallback: with_fallback([], fallback)
+
+
+def _read_shared_prompt(path: Path) -> str:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return ""
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _SHARED_PROMPT_CACHE.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    prompt = path.read_text(encoding="utf-8").strip()
+    _SHARED_PROMPT_CACHE[path] = (stamp, prompt)
+    return prompt
+
+
+def _load_shared_tools_dir(path: Path) -> List[object]:
+    # Stamp each top-level tool module: editing a module does not change the
+    # directory's own mtime.
+    try:
+        with os.scandir(path) as entries:
+            modules = [
+                (entry.name, entry.stat())
+                for entry in entries
+                if entry.name.endswith(".py") and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return load_tools_from_dir(path)
+    stamp = tuple(
+        sorted((name, stat.st_mtime_ns, stat.st_size) for name, stat in modules)
+    )
+    cached = _SHARED_TOOLS_CACHE.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    tools = load_tools_from_dir(path)
+    _SHARED_TOOLS_CACHE[path] = (stamp, tools)
+    return tools
+
+
+def _with_references(search_fn: Any, references: List[Path]) -> Any:
+    def wrapped_fn(agent, query: str) -> str:
+        return search_fn(agent, query, skill_references=references)
+
+    return wrapped_fn
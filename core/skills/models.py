@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, List, Sequence, Tuple
+from typing import Any, Dict, FrozenSet, List, Sequence, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SkillMetadata:
     """Lightweight metadata loaded without pulling full skill context."""
 
@@ -23,7 +24,29 @@ class SkillMetadata:
     refs_relpath: Path = field(default_factory=lambda: Path("refs"))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class SkillMatchProfile:
+    """Lowercased routing data for a skill, precomputed when it is discovered."""
+
+    metadata: SkillMetadata
+    match_terms: Tuple[str, ...]
+    tags: Tuple[str, ...]
+    tag_set: FrozenSet[str]
+    description_counts: Dict[str, int] = field(compare=False)
+
+    @classmethod
+    def from_metadata(cls, metadata: SkillMetadata) -> "SkillMatchProfile":
+        tags = tuple(tag.lower() for tag in metadata.tags if tag)
+        return cls(
+            metadata=metadata,
+            match_terms=tuple(term for term in metadata.match_terms if term),
+            tags=tags,
+            tag_set=frozenset(tags),
+            description_counts=dict(Counter(metadata.description.lower().split())),
+        )
+
+
+@dataclass(slots=True)
 class SkillPackage:
     """Fully-resolved skill definition ready for orchestration."""
 
@@ -33,7 +56,7 @@ class SkillPackage:
     references: List[Path] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     """Aggregated instructions, tools, and references for an agent."""
 
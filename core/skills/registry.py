@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence
-
-import yaml
+from typing import Dict, Iterable, List, Sequence, Tuple
 
 from ..loaders.ref_loader import load_references_from_dir
 from ..loaders.tool_loader import load_tools_from_dir
-from .models import SkillMetadata, SkillPackage
+from ..loaders.yaml_loader import load_yaml
+from .models import SkillMatchProfile, SkillMetadata, SkillPackage
+from .term_index import SkillTermIndex
+
+_MAX_PARSE_WORKERS = min(32, (os.cpu_count() or 4) * 4)
 
 
 class SkillRegistry:
@@ -20,28 +24,69 @@ class SkillRegistry:
         self._root = root
         self._catalog: Dict[str, SkillMetadata] = {}
         self._package_cache: Dict[str, SkillPackage] = {}
+        self._match_profiles: List[SkillMatchProfile] = []
+        self._term_index = SkillTermIndex(())
+        self._revision = 0
+        # Parsed manifests keyed by path, tagged with (st_mtime_ns, st_size) so
+        # reload() only re-parses manifests that changed on disk.
+        self._manifest_cache: Dict[Path, Tuple[int, int, SkillMetadata]] = {}
         self._discover()
 
     @property
     def root(self) -> Path:
         return self._root
 
+    @property
+    def revision(self) -> int:
+        """Counter bumped on every reload, for invalidating derived caches."""
+        return self._revision
+
     def _discover(self) -> None:
         if not self._root.exists():
             return
-        for path in sorted(self._root.iterdir()):
-            if not path.is_dir():
+        with os.scandir(self._root) as entries:
+            skill_dirs = sorted(entry.path for entry in entries if entry.is_dir())
+
+        stamps: List[Tuple[Path, int, int]] = []
+        for skill_dir in skill_dirs:
+            manifest = Path(skill_dir) / "skill.yaml"
+            try:
+                stat = manifest.stat()
+            except FileNotFoundError:
                 continue
-            manifest = path / "skill.yaml"
-            if not manifest.exists():
-                continue
-            metadata = self._parse_manifest(manifest)
+            stamps.append((manifest, stat.st_mtime_ns, stat.st_size))
+
+        stale = [
+            manifest
+            for manifest, mtime_ns, size in stamps
+            if self._manifest_cache.get(manifest, (None, None))[:2] != (mtime_ns, size)
+        ]
+        # File reads and libyaml parsing release the GIL, so cache misses
+        # are parsed concurrently; results are gathered in directory order.
+        if len(stale) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(_MAX_PARSE_WORKERS, len(stale))
+            ) as executor:
+                parsed = dict(zip(stale, executor.map(self._parse_manifest, stale)))
+        else:
+            parsed = {manifest: self._parse_manifest(manifest) for manifest in stale}
+
+        manifest_cache: Dict[Path, Tuple[int, int, SkillMetadata]] = {}
+        for manifest, mtime_ns, size in stamps:
+            metadata = parsed.get(manifest) or self._manifest_cache[manifest][2]
+            manifest_cache[manifest] = (mtime_ns, size, metadata)
             if metadata.id in self._catalog:
                 raise ValueError(f"Duplicate skill id detected: {metadata.id}")
             self._catalog[metadata.id] = metadata
+        self._manifest_cache = manifest_cache
+        self._match_profiles = [
+            SkillMatchProfile.from_metadata(metadata)
+            for metadata in self.list_metadata()
+        ]
+        self._term_index = SkillTermIndex(self._match_profiles)
 
     def _parse_manifest(self, manifest_path: Path) -> SkillMetadata:
-        data = yaml.safe_load(manifest_path.read_text(encoding="utf-8")) or {}
+        data = load_yaml(manifest_path.read_text(encoding="utf-8")) or {}
         if "id" not in data:
             raise ValueError(f"Skill manifest {manifest_path} missing 'id'")
 
@@ -74,6 +119,14 @@ class SkillRegistry:
     def list_metadata(self) -> List[SkillMetadata]:
         return sorted(self._catalog.values(), key=lambda item: item.id)
 
+    def list_match_profiles(self) -> List[SkillMatchProfile]:
+        """Precomputed routing data for every skill, ordered by skill id."""
+        return self._match_profiles
+
+    def term_index(self) -> SkillTermIndex:
+        """Inverted index over the match profiles, rebuilt on discovery."""
+        return self._term_index
+
     def get_metadata(self, skill_id: str) -> SkillMetadata:
         if skill_id not in self._catalog:
             raise KeyError(f"Unknown skill id: {skill_id}")
@@ -114,6 +167,9 @@ class SkillRegistry:
     def reload(self) -> None:
         """Clear discovery caches so changes on disk are reloaded."""
 
+        self._revision += 1
         self._catalog.clear()
         self._package_cache.clear()
+        self._match_profiles = []
+        self._term_index = SkillTermIndex(())
         self._discover()
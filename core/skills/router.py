@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from collections import Counter
-from difflib import SequenceMatcher
+from functools import lru_cache
 import re
-from typing import Iterable, List, Sequence
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Tuple
 
-from .models import SkillMetadata
+from .models import SkillMatchProfile, SkillMetadata
 from .registry import SkillRegistry
+from .term_index import is_similar, similar_lengths, similarity
 
 
 class SkillRouter:
@@ -16,6 +16,9 @@ class SkillRouter:
 
     def __init__(self, registry: SkillRegistry) -> None:
         self._registry = registry
+        # Repeated messages (the same prompt for several agents, retries) skip
+        # scoring; the registry revision keys out results from before a reload.
+        self._route_cached = lru_cache(maxsize=1024)(self._route)
 
     def route(
         self,
@@ -28,70 +31,118 @@ class SkillRouter:
         if not message:
             return []
 
+        required_tags = frozenset(tag.lower() for tag in tags) if tags else None
+        return list(
+            self._route_cached(
+                message, required_tags, limit, min_score, self._registry.revision
+            )
+        )
+
+    def route_batch(
+        self,
+        messages: Sequence[str],
+        *,
+        limit: int | None = None,
+        tags: Iterable[str] | None = None,
+        min_score: float = 0.0,
+    ) -> List[List[SkillMetadata]]:
+        """Route several messages with shared options, scoring each one once."""
+
+        required_tags = frozenset(tag.lower() for tag in tags) if tags else None
+        revision = self._registry.revision
+        routed: Dict[str, Tuple[SkillMetadata, ...]] = {"": ()}
+        results: List[List[SkillMetadata]] = []
+        for message in messages:
+            matches = routed.get(message)
+            if matches is None:
+                matches = self._route_cached(
+                    message, required_tags, limit, min_score, revision
+                )
+                routed[message] = matches
+            results.append(list(matches))
+        return results
+
+    def _route(
+        self,
+        message: str,
+        required_tags: FrozenSet[str] | None,
+        limit: int | None,
+        min_score: float,
+        revision: int,
+    ) -> Tuple[SkillMetadata, ...]:
         normalized_message = message.lower()
-        tokens = _tokenize(normalized_message)
-        token_counts = Counter(tokens)
-        token_set = set(tokens)
-        required_tags = {tag.lower() for tag in tags} if tags else None
+        token_set = frozenset(_tokenize(normalized_message))
+        tokens_by_length: Dict[int, List[str]] = {}
+        for token in token_set:
+            tokens_by_length.setdefault(len(token), []).append(token)
+
+        profiles = self._registry.list_match_profiles()
+        positions: Iterable[int] = range(len(profiles))
+        if min_score >= 0:
+            # Only skills related to at least one token can score above zero.
+            index = self._registry.term_index()
+            positions = sorted(
+                frozenset().union(*(index.candidates(token) for token in token_set))
+            )
 
         scored: List[tuple[float, SkillMetadata]] = []
-        for metadata in self._registry.list_metadata():
-            if required_tags and not required_tags.intersection(
-                tag.lower() for tag in metadata.tags
-            ):
+        for position in positions:
+            profile = profiles[position]
+            if required_tags and required_tags.isdisjoint(profile.tag_set):
                 continue
-            score = self._score(metadata, normalized_message, token_counts, token_set)
+            score = self._score(
+                profile, normalized_message, token_set, tokens_by_length
+            )
             if score <= min_score:
                 continue
-            scored.append((score, metadata))
+            scored.append((score, profile.metadata))
 
         scored.sort(key=lambda item: item[0], reverse=True)
         if limit is not None:
             scored = scored[:limit]
-        return [metadata for _, metadata in scored]
+        return tuple(metadata for _, metadata in scored)
 
     def _score(
         self,
-        metadata: SkillMetadata,
+        profile: SkillMatchProfile,
         normalized_message: str,
-        token_counts: Counter[str],
-        token_set: set[str],
+        token_set: FrozenSet[str],
+        tokens_by_length: Dict[int, List[str]],
     ) -> float:
         score = 0.0
 
-        for term in metadata.match_terms:
-            if not term:
-                continue
+        for term in profile.match_terms:
             if term in normalized_message:
                 score += 3.0 + (0.05 * len(term))
-                continue
-
-            if term in token_set:
+            elif term in token_set:
                 score += 2.5
-                continue
+            else:
+                score += _fuzzy_score(term, tokens_by_length)
 
-            for token in token_set:
-                similarity = SequenceMatcher(None, term, token).ratio()
-                if similarity >= 0.82:
-                    score += 1.5 * similarity
-                    break
-
-        for tag in metadata.tags:
-            if not tag:
-                continue
-            if tag.lower() in normalized_message:
+        for tag in profile.tags:
+            if tag in normalized_message:
                 score += 2.0
-            elif token_counts.get(tag.lower(), 0) > 0:
+            elif tag in token_set:
                 score += 1.5
 
-        keywords: Sequence[str] = metadata.description.lower().split()
-        for keyword in keywords:
-            if token_counts.get(keyword, 0):
-                score += 0.25
+        description_counts = profile.description_counts
+        score += 0.25 * sum(
+            description_counts[keyword]
+            for keyword in description_counts.keys() & token_set
+        )
 
         return score
 
 
+def _fuzzy_score(term: str, tokens_by_length: Dict[int, List[str]]) -> float:
+    # Only tokens whose length can pass is_similar's bound are compared.
+    for length in similar_lengths(len(term)):
+        for token in tokens_by_length.get(length, ()):
+            if is_similar(term, token):
+                return 1.5 * similarity(term, token)
+    return 0.0
+
+
 _TOKEN_PATTERN = re.compile(r"\b[\w-]+\b")
 
 
@@ -16,6 +16,19 @@ class SkillScaffoldConfig:
     match_terms: Sequence[str]
 
 
+DEFAULT_MANIFEST = """id: {id}
+name: {name}
+description: {description}
+tags:
+{tags}
+match_terms:
+{match_terms}
+version: "0.1.0"
+instructions: SKILL.md
+tools_path: tools
+refs_path: refs
+"""
+
 DEFAULT_SKILL_MD = """# {name}
 
 Describe the workflow, required tools, guardrails, and output format for this skill.
@@ -23,6 +36,11 @@ Describe the workflow, required tools, guardrails, and output format for this sk
 
 DEFAULT_TOOL_STUB = '"""Custom tools for this skill."""\n\nfrom __future__ import annotations\n\nfrom typing import List\n\n\nclass {class_name}:\n    """Add callable methods decorated with @tool or implement __call__."""\n\n    def __call__(self, query: str) -> str:  # pragma: no cover - stub\n        raise NotImplementedError("Implement tool logic")\n\n\nSKILL_TOOLS = [{class_name}()]\n'
 
+# Fixed content, so it is encoded once rather than on every scaffold.
+_REFS_README_BYTES = (
+    "Add supplementary resources for retrieval or documentation.\n".encode("utf-8")
+)
+
 
 def create_skill_package(
     base_dir: Path,
@@ -70,47 +88,33 @@ def create_skill_package(
 
 
 def _write_manifest(directory: Path, config: SkillScaffoldConfig) -> None:
-    manifest_path = directory / "skill.yaml"
-    manifest_lines = [
-        f"id: {config.skill_id}",
-        f"name: {config.name}",
-        f"description: {config.description}",
-        "tags:",
-    ]
-    manifest_lines.extend(f"  - {tag}" for tag in config.tags or ("general",))
-    manifest_lines.append("match_terms:")
-    manifest_lines.extend(
-        f"  - {term}" for term in config.match_terms or (config.skill_id,)
-    )
-    manifest_lines.extend(
-        [
-            'version: "0.1.0"',
-            "instructions: SKILL.md",
-            "tools_path: tools",
-            "refs_path: refs",
-        ]
+    manifest = DEFAULT_MANIFEST.format(
+        id=config.skill_id,
+        name=config.name,
+        description=config.description,
+        tags=_yaml_list(config.tags or ("general",)),
+        match_terms=_yaml_list(config.match_terms or (config.skill_id,)),
     )
-    manifest_path.write_text("\n".join(manifest_lines) + "\n", encoding="utf-8")
+    (directory / "skill.yaml").write_bytes(manifest.encode("utf-8"))
+
+
+def _yaml_list(items: Iterable[str]) -> str:
+    return "\n".join(f"  - {item}" for item in items)
 
 
 def _write_skill_md(directory: Path, config: SkillScaffoldConfig) -> None:
-    (directory / "SKILL.md").write_text(
-        DEFAULT_SKILL_MD.format(name=config.name),
-        encoding="utf-8",
+    (directory / "SKILL.md").write_bytes(
+        DEFAULT_SKILL_MD.format(name=config.name).encode("utf-8")
     )
 
 
 def _write_tool_stub(directory: Path, config: SkillScaffoldConfig) -> None:
     class_name = f"{config.skill_id.title().replace('_', '')}Tools"
     tool_file = directory / "tools" / "toolkit.py"
-    tool_file.write_text(
-        DEFAULT_TOOL_STUB.format(class_name=class_name),
-        encoding="utf-8",
+    tool_file.write_bytes(
+        DEFAULT_TOOL_STUB.format(class_name=class_name).encode("utf-8")
     )
 
 
 def _write_refs_placeholder(directory: Path) -> None:
-    (directory / "refs" / "README.md").write_text(
-        "Add supplementary resources for retrieval or documentation.\n",
-        encoding="utf-8",
-    )
+    (directory / "refs" / "README.md").write_bytes(_REFS_README_BYTES)
@@ -0,0 +1,118 @@
+"""Inverted index from routing words to the skills that use them."""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Dict, FrozenSet, Sequence, Set
+
+from .models import SkillMatchProfile
+
+FUZZY_THRESHOLD = 0.82
+
+
+class SkillTermIndex:
+    """Map match terms, tags, and description words to skill positions.
+
+    :meth:`candidates` follows the same relations the router scores
+    (equality, substring, and fuzzy similarity), so the skills it returns
+    for a message's tokens include every skill that can score above zero.
+    Each relation is checked only against the words the router applies it
+    to, and through lookups rather than a scan of the whole vocabulary.
+    """
+
+    def __init__(self, profiles: Sequence[SkillMatchProfile]) -> None:
+        postings: Dict[str, Set[int]] = defaultdict(set)
+        term_postings: Dict[str, Set[int]] = defaultdict(set)
+        fuzzy_postings: Dict[int, Dict[str, Set[int]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+        for position, profile in enumerate(profiles):
+            for phrase in (*profile.match_terms, *profile.tags):
+                term_postings[phrase].add(position)
+                for word in phrase.split():
+                    term_postings[word].add(position)
+            for term in profile.match_terms:
+                fuzzy_postings[len(term)][term].add(position)
+            for word in profile.description_counts:
+                postings[word].add(position)
+        for word, positions in term_postings.items():
+            postings[word] |= positions
+
+        # Terms and tags also match when they contain, or are contained in, a
+        # token; indexing every substring of them turns both into lookups.
+        substring_postings: Dict[str, Set[int]] = defaultdict(set)
+        for word, positions in term_postings.items():
+            for start in range(len(word)):
+                for stop in range(start + 1, len(word) + 1):
+                    substring_postings[word[start:stop]] |= positions
+
+        self._postings = _freeze(postings)
+        self._term_postings = _freeze(term_postings)
+        self._substring_postings = _freeze(substring_postings)
+        self._fuzzy_postings = {
+            length: _freeze(terms) for length, terms in fuzzy_postings.items()
+        }
+        self._longest_term = max(map(len, term_postings), default=0)
+        self.candidates = lru_cache(maxsize=4096)(self._candidates)
+
+    def _candidates(self, token: str) -> FrozenSet[int]:
+        """Positions of skills whose indexed words relate to *token*."""
+        related = [
+            self._postings.get(token, frozenset()),
+            self._substring_postings.get(token, frozenset()),
+        ]
+        # Terms inside the token are among its substrings, which are no
+        # longer than the longest term.
+        term_postings = self._term_postings
+        for start in range(len(token)):
+            stop_at = min(start + self._longest_term, len(token))
+            for stop in range(start + 1, stop_at + 1):
+                positions = term_postings.get(token[start:stop])
+                if positions is not None:
+                    related.append(positions)
+        # Only match terms are fuzzy matched, and only lengths that can pass
+        # is_similar's bound are compared.
+        for length in similar_lengths(len(token)):
+            for term, positions in self._fuzzy_postings.get(length, {}).items():
+                if is_similar(term, token):
+                    related.append(positions)
+        return frozenset().union(*related)
+
+
+def _freeze(postings: Dict[str, Set[int]]) -> Dict[str, FrozenSet[int]]:
+    return {word: frozenset(positions) for word, positions in postings.items()}
+
+
+def is_similar(term: str, token: str) -> bool:
+    term_length = len(term)
+    token_length = len(token)
+    # ratio() is at most 2*min(len)/sum(len); skip pairs that cannot reach
+    # the threshold without running the full comparison.
+    if 2 * min(term_length, token_length) < FUZZY_THRESHOLD * (
+        term_length + token_length
+    ):
+        return False
+    return similarity(term, token) >= FUZZY_THRESHOLD
+
+
+@lru_cache(maxsize=16384)
+def similarity(term: str, token: str) -> float:
+    # Skill terms and message words repeat heavily across requests, so the
+    # pairwise ratio is memoised; quick_ratio() is a cheaper upper bound that
+    # rejects most non-matches before the full comparison.
+    matcher = SequenceMatcher(None, term, token)
+    if matcher.quick_ratio() < FUZZY_THRESHOLD:
+        return 0.0
+    return matcher.ratio()
+
+
+@lru_cache(maxsize=256)
+def similar_lengths(length: int) -> range:
+    # 2*min(len) >= threshold*sum(len) bounds the other length on both sides;
+    # rounding outwards keeps the exact check in is_similar authoritative.
+    shortest = math.floor(FUZZY_THRESHOLD * length / (2 - FUZZY_THRESHOLD))
+    longest = math.ceil((2 - FUZZY_THRESHOLD) * length / FUZZY_THRESHOLD)
+    return range(shortest, longest + 1)
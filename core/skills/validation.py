@@ -22,23 +22,15 @@ class SkillMetadataModel(BaseModel):
     tools_relpath: Path = Field(default=Path("tools"))
     refs_relpath: Path = Field(default=Path("refs"))
 
-    @field_validator("id")
-    @classmethod
-    def validate_id(cls, value: str) -> str:
-        if not value.replace("_", "").isalnum():
-            raise ValueError(
-                "Skill ID must contain only lowercase letters, numbers, and underscores"
-            )
-        return value
-
     @field_validator("tags", "match_terms", mode="before")
     @classmethod
     def normalize_sequences(cls, value: Any) -> tuple[str, ...]:
-        if value is None:
+        # A bare string would otherwise be split into characters.
+        if not value or isinstance(value, str):
             return ()
-        if isinstance(value, (list, tuple, set)):
-            return tuple(str(item).strip() for item in value if item)
-        return ()
+        if not isinstance(value, (list, tuple, set)):
+            raise ValueError("Expected a list of strings")
+        return tuple(str(item).strip() for item in value if item)
 
     class Config:
         frozen = True
@@ -83,7 +75,9 @@ class SkillMetadataResponse(BaseModel):
 
     @classmethod
     def from_metadata(cls, metadata: SkillMetadataModel) -> "SkillMetadataResponse":
-        return cls(
+        # Skill metadata is validated when the manifest is parsed, so the
+        # response is assembled without re-running field validation.
+        return cls.model_construct(
             id=metadata.id,
             name=metadata.name,
             description=metadata.description,
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import json
 import uuid
-from typing import Any, Callable, Optional, Type, TypeVar
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional, Type, TypeVar
 
 from agno.agent import Agent
 from pydantic import BaseModel, ValidationError
 
 from .hallucination_detector import get_hallucination_detector
-from .metrics_collector import ExecutionMetrics, get_metrics_collector
+from .metrics_collector import ExecutionMetrics, ValidationStatus, get_metrics_collector
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -31,6 +33,13 @@ class ValidationLoop:
         self.metrics_collector = get_metrics_collector() if enable_metrics else None
         self.hallucination_detector = (
             get_hallucination_detector() if enable_hallucination_check else None
+        )
+
+    def validate_and_fix(
+        self,
+        response_text: str,
+        schema: Type[T],
+        transform_fn: Optional[Callable[[str], dict[str, Any]]] = None,
         input_context: Optional[str] = None,
     ) -> T:
         """
@@ -59,11 +68,16 @@ class ValidationLoop:
             )
             metrics.input_text = input_context or response_text[:500]
             metrics.performance.agent_name = getattr(self.agent, "name", "unknown")
- schema: Pydantic model class to validate against
-            transform_fn: Optional function to extract dict from response_text
 
-        Returns:
-            Validated sult = schema.model_validate(data)
+        attempt = 0
+        current_response = response_text
+
+        while attempt <= self.max_retries:
+            try:
+                # Extract structured data if transform provided
+                if transform_fn:
+                    data = transform_fn(current_response)
+                    result = schema.model_validate(data)
                 else:
                     # Assume JSON string
                     result = schema.model_validate_json(current_response)
@@ -80,43 +94,25 @@ class ValidationLoop:
                             context=input_context,
                         )
                         metrics.validation = validation_metrics
-
-                    # Mark as valid if no hallucination check or passed
-                    if not self.hallucination_detector:
-                        from .metrics_collector import ValidationStatus
-
+                    else:
+                        # Mark as valid if no hallucination check
                         metrics.validation.status = ValidationStatus.VALID
                         metrics.validation.confidence_score = 1.0
-update metrics and re-raise
-                    if metrics:
-                        metrics.performance.end()
-                        metrics.error = str(e)
-                        from .metrics_collector import ValidationStatus
 
-                        metrics.validation.status = ValidationStatus.INVALID
-                        metrics.validation.confidence_score = 0.0
+                    self._finalize_metrics(metrics)
                 return result
-        """
-        attempt = 0
-        current_response = response_text
-        validation_errors: list[str] = []
-
-        while attempt <= self.max_retries:
-            try:
-                # Extract structured data if transform provided
-                if transform_fn:
-                    data = transform_fn(current_response)
-                    return schema.model_validate(data)
-                else:
-                    # Assume JSON string
-                    return schema.model_validate_json(current_response)
 
             except ValidationError as e:
-                validation_errors.append(str(e))
                 attempt += 1
 
                 if attempt > self.max_retries:
-                    # Final failure - just re-raise the original ValidationError
+                    # Final failure - update metrics and re-raise
+                    if metrics:
+                        metrics.performance.end()
+                        metrics.error = str(e)
+                        metrics.validation.status = ValidationStatus.INVALID
+                        metrics.validation.confidence_score = 0.0
+                        self._finalize_metrics(metrics)
                     raise
 
                 # Request correction from agent
@@ -138,6 +134,11 @@ update metrics and re-raise
         # This should never be reached due to max_retries check above
         raise RuntimeError("Unexpected validation loop exit")
 
+    def _finalize_metrics(self, metrics: ExecutionMetrics) -> None:
+        """Hand the completed execution back to the collector for aggregation."""
+        if self.metrics_collector:
+            self.metrics_collector.finalize(metrics)
+
     def _build_correction_prompt(
         self,
         original_response: str,
@@ -146,34 +147,66 @@ update metrics and re-raise
         attempt: int,
     ) -> str:
         """Build a correction prompt for the agent."""
-        schema_description = schema.model_json_schema()
-        error_details = error.errors()
+        # Only loc, msg and type feed the prompt, so skip copying inputs,
+        # context and doc URLs into each error dict.
+        error_details = error.errors(
+            include_url=False, include_context=False, include_input=False
+        )
 
-        prompt = f"""Your previous output failed validation (attempt {attempt}/{self.max_retries}).
+        return "\n".join(
+            [
+                f"Your previous output failed validation "
+                f"(attempt {attempt}/{self.max_retries}).",
+                "",
+                "VALIDATION ERRORS:",
+                self._format_validation_errors(error_details),
+                "",
+                "EXPECTED SCHEMA:",
+                _cached_json_schema(schema),
+                "",
+                "ORIGINAL OUTPUT:",
+                original_response,
+                "",
+                "Please provide a corrected response that strictly adheres to "
+                "the schema above.",
+                "Output ONLY the corrected JSON without any explanation or "
+                "markdown formatting.",
+            ]
+        )
+
+    @staticmethod
+    def _format_validation_errors(errors: list[dict[str, Any]]) -> str:
+        """Format validation errors for prompt as compact JSON.
 
-VALIDATION ERRORS:
-{self._format_validation_errors(error_details)}
+        One object per error with its dotted field path, message and error
+        type, so the model can match each error to a field of the schema.
+        """
+        return json.dumps(
+            [
+                {
+                    "loc": _location_label(err.get("loc", ())),
+                    "msg": err.get("msg", "Unknown error"),
+                    "type": err.get("type", "unknown"),
+                }
+                for err in errors
+            ],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
 
-EXPECTED SCHEMA:
-{schema_description}
 
-ORIGINAL OUTPUT:
-{original_response}
+def _location_label(loc: Iterable[int | str]) -> str:
+    return ".".join(map(str, loc))
 
-Please provide a corrected response that strictly adheres to the schema above. 
-Output ONLY the corrected JSON without any explanation or markdown formatting."""
 
-        return prompt
+@lru_cache(maxsize=256)
+def _cached_json_schema(schema: Type[BaseModel]) -> str:
+    """Render a model's JSON schema once per class; it never changes.
 
-    @staticmethod
-    def _format_validation_errors(errors: list[dict[str, Any]]) -> str:
-        """Format validation errors for prompt."""
-        formatted = []
-        for err in errors:
-            location = " -> ".join(str(loc) for loc in err.get("loc", []))
-            msg = err.get("msg", "Unknown error")
-            formatted.append(f"  • {location}: {msg}")
-        return "\n".join(formatted)
+    Compact separators keep the schema, which is resent on every retry, as
+    small as possible in the prompt.
+    """
+    return json.dumps(schema.model_json_schema(), separators=(",", ":"))
 
 
 def validate_response(
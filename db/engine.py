@@ -0,0 +1,37 @@
+from os import getenv
+from typing import Any, Optional
+
+from sqlalchemy.engine import Engine, create_engine
+from sqlalchemy.pool import NullPool
+
+from db.url import get_db_url
+
+
+def get_engine_options() -> dict[str, Any]:
+    """Connection pool settings shared by every engine in the app.
+
+    The defaults size the pool for concurrent request workers; LIFO checkout
+    keeps the most recently used (warm) connections in rotation.
+    """
+    return {
+        "pool_pre_ping": True,
+        "pool_size": int(getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(getenv("DB_MAX_OVERFLOW", "40")),
+        "pool_recycle": int(getenv("DB_POOL_RECYCLE", "1800")),
+        "pool_use_lifo": True,
+        "query_cache_size": 1200,
+    }
+
+
+def create_db_engine(database_url: Optional[str] = None, **overrides: Any) -> Engine:
+    """Create an engine with the shared pool settings.
+
+    Keyword arguments override the defaults; passing ``poolclass=NullPool``
+    (as the tests do) drops the queue-pool sizing options.
+    """
+    options = get_engine_options()
+    if overrides.get("poolclass") is NullPool:
+        for key in ("pool_size", "max_overflow", "pool_recycle", "pool_use_lifo"):
+            options.pop(key)
+    options.update(overrides)
+    return create_engine(database_url or get_db_url(), **options)
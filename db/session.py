@@ -1,14 +1,15 @@
 from typing import Generator
 
 from agno.db.postgres import PostgresDb
-from sqlalchemy.engine import Engine, create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from db.engine import create_db_engine
 from db.url import get_db_url
 
 # Create SQLAlchemy Engine using a database URL
 db_url: str = get_db_url()
-db_engine: Engine = create_engine(db_url, pool_pre_ping=True)
+db_engine: Engine = create_db_engine(db_url)
 
 # Create a SessionLocal class
 # https://fastapi.tiangolo.com/tutorial/sql-databases/#create-a-sessionlocal-class
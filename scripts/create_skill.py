@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import List, Optional
 
@@ -11,6 +12,17 @@ import typer
 from core.skills.scaffold import create_skill_package
 
 CONFIG_RELATIVE_PATH = Path("core/skills_config.yaml")
+REGISTER_AGENT = "agno-assist"
+
+_AGENT_SECTION = re.compile(
+    rf"^  {re.escape(REGISTER_AGENT)}:[ \t]*\n(?:(?:    .*|[ \t]*)(?:\n|\Z))*",
+    re.MULTILINE,
+)
+_ADDITIONAL_LIST = re.compile(
+    r"^(?P<indent>[ \t]+)additional:(?:[ \t]*\[\][ \t]*$"
+    r"|[ \t]*\n(?P<items>(?:(?P=indent)[ \t]+- .*\n)+))",
+    re.MULTILINE,
+)
 
 app = typer.Typer(add_completion=False)
 
@@ -72,19 +84,80 @@ def _register_skill(
         typer.echo(f"Warning: {config_path} not found; skipping registration", err=True)
         return
 
-    import yaml
+    text = config_path.read_text(encoding="utf-8")
+    updated = _append_additional(text, skill_id)
+    if updated is None:
+        updated = _append_additional_roundtrip(text, skill_id)
+    if updated != text:
+        config_path.write_text(updated, encoding="utf-8")
+    typer.echo(f"Registered skill '{skill_id}' under agno-assist auto routing")
+
+
+def _append_additional(text: str, skill_id: str) -> Optional[str]:
+    """Insert *skill_id* into the agent's ``additional`` list in place.
+
+    Only the matched list is rewritten, so comments and formatting elsewhere
+    in the file survive. Returns ``None`` when the layout is not the one the
+    default config uses, leaving the caller to fall back to a YAML round-trip.
+    """
+
+    existing = _registered_skills(text)
+    if existing is not None and skill_id in existing:
+        return text
+
+    section = _AGENT_SECTION.search(text)
+    if section is None:
+        return None
+    matches = list(_ADDITIONAL_LIST.finditer(text, section.start(), section.end()))
+    if len(matches) != 1:
+        return None
+
+    match = matches[0]
+    indent = match.group("indent")
+    items = match.group("items")
+    if items is None:
+        block = f"{indent}additional:\n{indent}  - {skill_id}"
+        updated = text[: match.start()] + block + text[match.end() :]
+    else:
+        item_indent = items[: len(items) - len(items.lstrip())]
+        insert_at = match.start("items") + len(items)
+        updated = text[:insert_at] + f"{item_indent}- {skill_id}\n" + text[insert_at:]
+
+    # The pattern cannot tell which mapping the matched list belongs to, so
+    # only accept the edit if it changed skills.auto.additional as intended.
+    if _registered_skills(updated) != (existing or []) + [skill_id]:
+        return None
+    return updated
+
 
-    data = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+def _registered_skills(text: str) -> Optional[List[str]]:
+    """Return the agent's ``skills.auto.additional`` list, if the config has one."""
+
+    from yaml import YAMLError
+
+    from core.loaders.yaml_loader import load_yaml
+
+    try:
+        additional = load_yaml(text)["agents"][REGISTER_AGENT]["skills"]["auto"][
+            "additional"
+        ]
+    except (YAMLError, KeyError, TypeError):
+        return None
+    return additional if isinstance(additional, list) else None
+
+
+def _append_additional_roundtrip(text: str, skill_id: str) -> str:
+    from core.loaders.yaml_loader import dump_yaml, load_yaml
+
+    data = load_yaml(text) or {}
     agents = data.setdefault("agents", {})
-    agno_config = agents.setdefault("agno-assist", {})
+    agno_config = agents.setdefault(REGISTER_AGENT, {})
     skills_cfg = agno_config.setdefault("skills", {})
     auto_cfg = skills_cfg.setdefault("auto", {})
     additional = auto_cfg.setdefault("additional", [])
     if skill_id not in additional:
         additional.append(skill_id)
-
-    config_path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
-    typer.echo(f"Registered skill '{skill_id}' under agno-assist auto routing")
+    return dump_yaml(data)
 
 
 if __name__ == "__main__":
@@ -19,9 +19,12 @@ DEFAULT_SHARED_TOOLS: tuple[Any, ...] = (
 
 
 def get_tools() -> Sequence[Any]:
-    """Return shared tool instances with telemetry and prompt helpers."""
+    """Return shared tool instances with telemetry and prompt helpers.
 
-    return list(DEFAULT_SHARED_TOOLS)
+    The tuple itself is returned; the tool loader copies it into its own list.
+    """
+
+    return DEFAULT_SHARED_TOOLS
 
 
 __all__ = ["DEFAULT_SHARED_TOOLS", "get_tools"]
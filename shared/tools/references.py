@@ -2,41 +2,218 @@
 
 from __future__ import annotations
 
+import heapq
+import math
+import mmap
+import os
+import re
+import sys
+from array import array
+from collections import Counter, defaultdict
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 from agno.tools import tool
 
+_MAX_SNIPPETS = 3
 
-def _search_file_content(file_path: Path, query: str) -> tuple[bool, str]:
+# Okapi BM25 parameters for ranking keyword hits.
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_TOKEN = re.compile(r"\w+")
+_PARAGRAPH_BREAK = re.compile(rb"\n\s*\n")
+
+
+@lru_cache(maxsize=256)
+def _query_pattern(query: str) -> re.Pattern[str]:
+    """Compile a case-insensitive pattern matching any whitespace-separated term."""
+    # Longer terms first so overlapping alternatives prefer the longest match.
+    terms = sorted(set(query.split()), key=lambda term: (-len(term), term))
+    return re.compile("|".join(map(re.escape, terms)), re.IGNORECASE)
+
+
+def _search_file_content(
+    file_path: Path, pattern: re.Pattern[str]
+) -> tuple[bool, str]:
     """Search a single file for query terms, returning matches with context."""
     try:
         content = file_path.read_text(encoding="utf-8", errors="ignore")
-        query_lower = query.lower()
 
-        if query_lower not in content.lower():
+        match = pattern.search(content)
+        if match is None:
             return False, ""
 
-        # Extract snippet with context
-        lines = content.split("\n")
+        # Jump from match to match in C and slice each context straight out
+        # of the text, so the file is never lowered or split into lines.
         matching_lines = []
+        while match is not None and len(matching_lines) < _MAX_SNIPPETS:
+            matching_lines.append(_line_context(content, match.start()))
+            line_end = content.find("\n", match.end())
+            if line_end < 0:
+                break
+            match = pattern.search(content, line_end + 1)
 
-        for i, line in enumerate(lines):
-            if query_lower in line.lower():
-                # Include context: 1 line before and 1 line after
-                start = max(0, i - 1)
-                end = min(len(lines), i + 2)
-                context_lines = lines[start:end]
-                matching_lines.append("\n".join(context_lines))
-
-        if matching_lines:
-            snippet = "\n...\n".join(matching_lines[:3])  # Limit to 3 matches
-            return True, f"[{file_path.name}]\n{snippet}\n"
-
-        return False, ""
+        snippet = "\n...\n".join(matching_lines)
+        return True, f"[{file_path.name}]\n{snippet}\n"
     except Exception:
         return False, ""
 
 
+def _line_context(content: str, position: int) -> str:
+    """Return the line holding *position* plus 1 line before and 1 line after."""
+    line_start = content.rfind("\n", 0, position) + 1
+    start = content.rfind("\n", 0, line_start - 1) + 1 if line_start else 0
+    line_end = content.find("\n", position)
+    if line_end < 0:
+        return content[start:]
+    end = content.find("\n", line_end + 1)
+    return content[start:] if end < 0 else content[start:end]
+
+
+class ReferenceChunk(NamedTuple):
+    """A paragraph of a skill reference file, the unit of keyword search.
+
+    Only the paragraph's byte span is kept; :meth:`read` loads its text from
+    the file when a search actually returns it.
+    """
+
+    skill_id: str
+    file_path: Path
+    chunk_index: int
+    start: int
+    end: int
+
+    def read(self) -> str:
+        with open(self.file_path, "rb") as handle:
+            handle.seek(self.start)
+            data = handle.read(self.end - self.start)
+        return data.decode("utf-8", errors="ignore")
+
+
+class ReferenceIndex:
+    """Inverted index over reference paragraphs, ranked with BM25.
+
+    Each term maps to parallel ``array('i')`` posting lists of chunk ids and
+    term frequencies, so a search only touches the postings of its own
+    terms instead of rescanning every file.
+    """
+
+    def __init__(self, sources: Iterable[Tuple[str, Path]]) -> None:
+        self.chunks: List[ReferenceChunk] = []
+        self._lengths = array("i")
+        self._postings: Dict[str, Tuple[array, array]] = {}
+
+        for skill_id, file_path in sources:
+            # Every chunk of a skill shares one skill id string.
+            skill_id = sys.intern(skill_id)
+            try:
+                with open(file_path, "rb") as handle:
+                    # Scan the file through the page cache rather than
+                    # copying it onto the heap; empty files cannot be mapped.
+                    if os.fstat(handle.fileno()).st_size == 0:
+                        continue
+                    with mmap.mmap(
+                        handle.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as buffer:
+                        self._add_file(skill_id, file_path, buffer)
+            except OSError:
+                continue
+
+        total_length = sum(self._lengths)
+        self._average_length = (
+            total_length / len(self._lengths) if total_length else 1.0
+        )
+
+    def _add_file(self, skill_id: str, file_path: Path, buffer: mmap.mmap) -> None:
+        chunk_index = 0
+        for start, end in _paragraph_spans(buffer):
+            counts = Counter(
+                _tokenize(buffer[start:end].decode("utf-8", errors="ignore"))
+            )
+            if not counts:
+                continue
+            chunk_id = len(self.chunks)
+            self.chunks.append(
+                ReferenceChunk(skill_id, file_path, chunk_index, start, end)
+            )
+            chunk_index += 1
+            self._lengths.append(sum(counts.values()))
+            for term, frequency in counts.items():
+                chunk_ids, frequencies = self._postings.setdefault(
+                    term, (array("i"), array("i"))
+                )
+                chunk_ids.append(chunk_id)
+                frequencies.append(frequency)
+
+    def search(self, query: str, limit: int = 5) -> List[Tuple[float, ReferenceChunk]]:
+        """Return up to *limit* ``(score, chunk)`` pairs, best first."""
+        chunk_count = len(self.chunks)
+        lengths = self._lengths
+        length_scale = BM25_B / self._average_length
+        scores: Dict[int, float] = defaultdict(float)
+
+        for term in set(_tokenize(query)):
+            posting = self._postings.get(term)
+            if posting is None:
+                continue
+            chunk_ids, frequencies = posting
+            matched = len(chunk_ids)
+            idf = math.log(1 + (chunk_count - matched + 0.5) / (matched + 0.5))
+            for chunk_id, frequency in zip(chunk_ids, frequencies):
+                norm = BM25_K1 * (1 - BM25_B + length_scale * lengths[chunk_id])
+                scores[chunk_id] += idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+
+        best = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+        return [(score, self.chunks[chunk_id]) for chunk_id, score in best]
+
+
+def reference_index(sources: Sequence[Tuple[str, Path]]) -> ReferenceIndex:
+    """Return the index over *sources*, rebuilt only when a file changes."""
+    return _cached_index(
+        tuple((skill_id, path, _file_stamp(path)) for skill_id, path in sources)
+    )
+
+
+@lru_cache(maxsize=32)
+def _cached_index(
+    fingerprint: Tuple[Tuple[str, Path, Optional[Tuple[int, int]]], ...],
+) -> ReferenceIndex:
+    return ReferenceIndex((skill_id, path) for skill_id, path, _ in fingerprint)
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def _paragraph_spans(buffer: mmap.mmap) -> Iterator[Tuple[int, int]]:
+    """Yield the byte span of each paragraph, trimmed of surrounding space."""
+    start = 0
+    for match in _PARAGRAPH_BREAK.finditer(buffer):
+        yield _trimmed_span(buffer, start, match.start())
+        start = match.end()
+    yield _trimmed_span(buffer, start, len(buffer))
+
+
+def _trimmed_span(buffer: mmap.mmap, start: int, end: int) -> Tuple[int, int]:
+    raw = buffer[start:end]
+    stripped = raw.strip()
+    if not stripped:
+        return start, start
+    start += len(raw) - len(raw.lstrip())
+    return start, start + len(stripped)
+
+
 @tool(description="Search skill reference documents for relevant information")
 def search_skill_references(
     agent, query: str, skill_references: list | None = None
@@ -45,7 +222,8 @@ def search_skill_references(
     Search through skill reference files to find information matching the query.
 
     This tool performs keyword-based search across all reference documents
-    loaded for the current skill context. Use it when you need to find
+    loaded for the current skill context; a line matches when it contains
+    any of the whitespace-separated query terms, ignoring case. Use it when you need to find
     specific information from documentation, guides, or knowledge artifacts.
 
     Args:
@@ -63,12 +241,13 @@ def search_skill_references(
 
     results = []
     query = query.strip()
+    pattern = _query_pattern(query)
 
     for ref_path in skill_references:
         if not ref_path.exists() or not ref_path.is_file():
             continue
 
-        found, snippet = _search_file_content(ref_path, query)
+        found, snippet = _search_file_content(ref_path, pattern)
         if found:
             results.append(snippet)
 
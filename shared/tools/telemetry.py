@@ -2,14 +2,35 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
 
 from agno.tools import tool
 
+# (millisecond, formatted timestamp) of the last call; swapped as one tuple so
+# concurrent callers never observe a half-updated pair.
+_last_timestamp: tuple[int, str] = (-1, "")
+
+
+def _utc_isoformat() -> str:
+    """Return the current UTC time as ISO-8601, reusing it within a millisecond."""
+    global _last_timestamp
+
+    now_ms = time.time_ns() // 1_000_000
+    cached_ms, cached_iso = _last_timestamp
+    if now_ms == cached_ms:
+        return cached_iso
+
+    seconds, millis = divmod(now_ms, 1000)
+    moment = datetime.fromtimestamp(seconds, timezone.utc)
+    iso = moment.replace(microsecond=millis * 1000).isoformat(timespec="milliseconds")
+    _last_timestamp = (now_ms, iso)
+    return iso
+
 
 @tool(description="Emit a structured event log with ISO-8601 timestamp")
 def emit_skill_event(agent, event: str) -> str:
-    timestamp = datetime.now(timezone.utc).isoformat()
+    timestamp = _utc_isoformat()
     message = f"[{timestamp}] {event.strip()}"
     # Agent logger may not be available; return for downstream handling.
     return message
@@ -17,4 +38,4 @@ def emit_skill_event(agent, event: str) -> str:
 
 @tool(description="Return the current UTC timestamp for audit trails")
 def current_timestamp(agent) -> str:
-    return datetime.now(timezone.utc).isoformat()
+    return _utc_isoformat()
@@ -3,19 +3,36 @@
 from __future__ import annotations
 
 import hashlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from agno.tools import tool
-from sqlalchemy import Column, Integer, String, Text, create_engine
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Column, Integer, String, Text, insert, select
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.sql import text
 
-from db.url import get_db_url
+from db.engine import create_db_engine
 
 Base = declarative_base()
 
+# Chunks per embeddings request and INSERT; the OpenAI API accepts up to 2048.
+EMBEDDING_BATCH_SIZE = 64
+# Embedding requests kept in flight while earlier batches are written.
+EMBEDDING_CONCURRENCY = 4
+# Chunk keys are "<sha256 hex>_<chunk index>".
+CONTENT_HASH_LENGTH = 80
+# HNSW graph degree and build-time beam width for the embedding index.
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+# Query-time beam width; it also caps the candidates a filtered scan can
+# return, so it is never set below the requested limit.
+HNSW_EF_SEARCH = 100
+
 
 class ReferenceDocument(Base):
     """Embedded reference document with vector similarity search."""
@@ -25,11 +42,11 @@ class ReferenceDocument(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     skill_id = Column(String(255), nullable=False, index=True)
     file_path = Column(Text, nullable=False)
-    content_hash = Column(String(64), nullable=False, unique=True)
+    content_hash = Column(String(CONTENT_HASH_LENGTH), nullable=False, unique=True)
     content = Column(Text, nullable=False)
     chunk_index = Column(Integer, default=0)
-    # pgvector column - will be added via migration
-    # embedding = Column(Vector(1536))  # OpenAI ada-002 dimension
+    # Tables created before this column was mapped get it via migration
+    embedding = Column(Vector(1536))  # OpenAI ada-002 dimension
 
 
 class VectorReferenceStore:
@@ -40,14 +57,27 @@ class VectorReferenceStore:
         database_url: Optional[str] = None,
         embedding_model: str = "text-embedding-3-small",
     ) -> None:
-        url = database_url or get_db_url()
-        self.engine = create_engine(url, pool_pre_ping=True)
+        self.engine = create_db_engine(database_url)
         self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
         self.embedding_model = embedding_model
+        self._embedder = None
 
         # Create tables and enable pgvector extension
         self._initialize_database()
 
+    @property
+    def embedder(self):
+        """OpenAI embedder shared by every call, created on first use.
+
+        Reusing one instance keeps its HTTP client and connection pool warm
+        across searches instead of rebuilding them per request.
+        """
+        if self._embedder is None:
+            from agno.knowledge.embedder.openai import OpenAIEmbedder
+
+            self._embedder = OpenAIEmbedder(id=self.embedding_model)
+        return self._embedder
+
     def _initialize_database(self) -> None:
         """Create tables and enable pgvector extension."""
         with self.engine.connect() as conn:
@@ -74,16 +104,35 @@ class VectorReferenceStore:
                         "ALTER TABLE reference_documents ADD COLUMN embedding vector(1536)"
                     )
                 )
-                # Create HNSW index for fast similarity search
+            # Chunk keys outgrew the original varchar(64)
+            hash_length = conn.execute(
+                text(
+                    """
+                SELECT character_maximum_length
+                FROM information_schema.columns
+                WHERE table_name='reference_documents' AND column_name='content_hash'
+            """
+                )
+            ).scalar()
+            if hash_length is not None and hash_length < CONTENT_HASH_LENGTH:
                 conn.execute(
                     text(
-                        """
-                    CREATE INDEX IF NOT EXISTS reference_documents_embedding_idx 
-                    ON reference_documents USING hnsw (embedding vector_cosine_ops)
-                """
+                        "ALTER TABLE reference_documents ALTER COLUMN content_hash "
+                        f"TYPE varchar({CONTENT_HASH_LENGTH})"
                     )
                 )
-                conn.commit()
+            # Create HNSW index for fast similarity search; create_all adds the
+            # column on fresh tables, so this cannot hang off the migration.
+            conn.execute(
+                text(
+                    f"""
+                CREATE INDEX IF NOT EXISTS reference_documents_embedding_idx
+                ON reference_documents USING hnsw (embedding vector_cosine_ops)
+                WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})
+            """
+                )
+            )
+            conn.commit()
 
     def embed_references(
         self,
@@ -97,64 +146,97 @@ class VectorReferenceStore:
         Returns:
             Number of new chunks indexed
         """
-        from agno.embedder.openai import OpenAIEmbedder
-
-        embedder = OpenAIEmbedder(model=self.embedding_model)
         new_chunks = 0
-
         with self.SessionLocal() as session:
-            for path in reference_paths:
-                if not path.exists() or not path.is_file():
-                    continue
-
-                content = path.read_text(encoding="utf-8")
-                content_hash = hashlib.sha256(content.encode()).hexdigest()
-
-                # Check if already indexed
-                existing = (
-                    session.query(ReferenceDocument)
-                    .filter(ReferenceDocument.content_hash == content_hash)
-                    .first()
-                )
-                if existing:
-                    continue
-
-                # Chunk content for embedding
-                chunks = self._chunk_text(content, chunk_size)
-
-                for idx, chunk in enumerate(chunks):
-                    # Generate embedding
-                    embedding_result = embedder.get_embedding(chunk)
-                    embedding_vector = embedding_result.data[0].embedding
-
-                    # Store with vector
-                    doc = ReferenceDocument(
-                        skill_id=skill_id,
-                        file_path=str(path),
-                        content_hash=f"{content_hash}_{idx}",
-                        content=chunk,
-                        chunk_index=idx,
-                    )
-                    session.add(doc)
-                    session.flush()
-
-                    # Update embedding column via raw SQL (pgvector compatibility)
-                    session.execute(
-                        text(
-                            """
-                        UPDATE reference_documents 
-                        SET embedding = :embedding::vector 
-                        WHERE id = :doc_id
-                    """
-                        ),
-                        {"embedding": str(embedding_vector), "doc_id": doc.id},
-                    )
-                    new_chunks += 1
+            pending = self._iter_new_chunks(
+                session, skill_id, reference_paths, chunk_size
+            )
+            # Up to EMBEDDING_CONCURRENCY request-sized batches are embedded
+            # at once, and are written in order as each completes, so only
+            # that many batches are ever held in memory.
+            in_flight: deque[tuple[List[dict], Future]] = deque()
+            with ThreadPoolExecutor(max_workers=EMBEDDING_CONCURRENCY) as pool:
+                while batch := list(islice(pending, EMBEDDING_BATCH_SIZE)):
+                    texts = [row["content"] for row in batch]
+                    in_flight.append((batch, pool.submit(self._embed_batch, texts)))
+                    if len(in_flight) == EMBEDDING_CONCURRENCY:
+                        new_chunks += self._insert_batch(session, *in_flight.popleft())
+                while in_flight:
+                    new_chunks += self._insert_batch(session, *in_flight.popleft())
 
             session.commit()
 
         return new_chunks
 
+    @staticmethod
+    def _insert_batch(session, batch: List[dict], embedded: Future) -> int:
+        """Write *batch* with its vectors in one batched INSERT."""
+        for row, embedding in zip(batch, embedded.result()):
+            row["embedding"] = embedding
+        session.execute(insert(ReferenceDocument), batch)
+        return len(batch)
+
+    def _iter_new_chunks(
+        self,
+        session,
+        skill_id: str,
+        reference_paths: List[Path],
+        chunk_size: int,
+    ) -> Iterator[dict]:
+        """Yield insert rows for every chunk of the files not yet indexed."""
+        documents = {}
+        for path in reference_paths:
+            if not path.exists() or not path.is_file():
+                continue
+            content, content_hash = self._read_and_hash(path)
+            # Chunks are stored as "<hash>_<index>"; chunk 0 marks the file.
+            documents.setdefault(f"{content_hash}_0", (path, content, content_hash))
+
+        if not documents:
+            return
+
+        # Check every file against the index in one query
+        indexed = set(
+            session.scalars(
+                select(ReferenceDocument.content_hash).where(
+                    ReferenceDocument.content_hash.in_(documents)
+                )
+            )
+        )
+
+        for key, (path, content, content_hash) in documents.items():
+            if key in indexed:
+                continue
+
+            # Chunk content for embedding
+            for idx, chunk in enumerate(self._chunk_text(content, chunk_size)):
+                yield {
+                    "skill_id": skill_id,
+                    "file_path": str(path),
+                    "content_hash": f"{content_hash}_{idx}",
+                    "content": chunk,
+                    "chunk_index": idx,
+                }
+
+    @staticmethod
+    def _read_and_hash(path: Path) -> tuple[str, str]:
+        """Read *path* as text and hash it without re-encoding the text."""
+        data = path.read_bytes()
+        content = data.decode("utf-8")
+        if b"\r" in data:
+            # Match read_text's newline translation; the hash must stay stable
+            # for rows indexed before this path hashed the raw bytes.
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+            data = content.encode("utf-8")
+        return content, hashlib.sha256(data).hexdigest()
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed *texts* with a single embeddings API request."""
+        response = self.embedder.client.embeddings.create(
+            input=texts, model=self.embedding_model
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
     def search(
         self,
         query: str,
@@ -172,55 +254,96 @@ class VectorReferenceStore:
         Returns:
             List of matched documents with similarity scores
         """
-        from agno.embedder.openai import OpenAIEmbedder
+        return self.search_batch([query], skill_id=skill_id, limit=limit)[0]
 
-        embedder = OpenAIEmbedder(model=self.embedding_model)
-        query_embedding = embedder.get_embedding(query).data[0].embedding
+    def search_batch(
+        self,
+        queries: List[str],
+        skill_id: Optional[str] = None,
+        limit: int = 5,
+    ) -> List[List[dict]]:
+        """
+        Semantic search for several queries at once.
 
-        with self.SessionLocal() as session:
-            # Build similarity query
-            sql = """
-                SELECT 
+        All queries are embedded with one API request and matched in one SQL
+        statement: each query vector drives its own index scan through a
+        lateral join, so the round trips do not grow with the batch.
+
+        Args:
+            queries: Search queries
+            skill_id: Optional skill filter
+            limit: Maximum results to return per query
+
+        Returns:
+            One list of matched documents per query, in query order
+        """
+        if not queries:
+            return []
+        query_embeddings = self._embed_batch(queries)
+
+        sql = """
+            SELECT
+                q.ord,
+                d.skill_id,
+                d.file_path,
+                d.content,
+                d.chunk_index,
+                d.similarity
+            FROM unnest(CAST(:query_embeddings AS vector[]))
+                WITH ORDINALITY AS q(embedding, ord)
+            CROSS JOIN LATERAL (
+                SELECT
                     skill_id,
                     file_path,
                     content,
                     chunk_index,
-                    1 - (embedding <=> :query_embedding::vector) as similarity
+                    1 - (embedding <=> q.embedding) AS similarity
                 FROM reference_documents
-            """
-            params = {"query_embedding": str(query_embedding), "limit": limit}
-
-            if skill_id:
-                sql += " WHERE skill_id = :skill_id"
-                params["skill_id"] = skill_id
-
-            sql += " ORDER BY embedding <=> :query_embedding::vector LIMIT :limit"
-
-            result = session.execute(text(sql), params)
-
-            return [
-                {
-                    "skill_id": row[0],
-                    "file_path": row[1],
-                    "content": row[2],
-                    "chunk_index": row[3],
-                    "similarity": float(row[4]),
-                }
-                for row in result
-            ]
+                {where}
+                ORDER BY embedding <=> q.embedding
+                LIMIT :limit
+            ) AS d
+            ORDER BY q.ord, d.similarity DESC
+        """
+        params = {
+            "query_embeddings": _vector_array_literal(query_embeddings),
+            "limit": limit,
+        }
+        where = ""
+        if skill_id:
+            where = "WHERE skill_id = :skill_id"
+            params["skill_id"] = skill_id
+
+        results: List[List[dict]] = [[] for _ in queries]
+        with self.SessionLocal() as session:
+            ef_search = max(HNSW_EF_SEARCH, limit)
+            session.execute(text(f"SET LOCAL hnsw.ef_search = {ef_search}"))
+            for row in session.execute(text(sql.format(where=where)), params):
+                results[row[0] - 1].append(
+                    {
+                        "skill_id": row[1],
+                        "file_path": row[2],
+                        "content": row[3],
+                        "chunk_index": row[4],
+                        "similarity": float(row[5]),
+                    }
+                )
+        return results
 
     @staticmethod
-    def _chunk_text(text: str, chunk_size: int) -> List[str]:
-        """Split text into overlapping chunks."""
-        chunks = []
+    def _chunk_text(text: str, chunk_size: int) -> Iterator[str]:
+        """Yield overlapping chunks of *text*, skipping blank ones."""
         overlap = chunk_size // 4
 
         for i in range(0, len(text), chunk_size - overlap):
             chunk = text[i : i + chunk_size]
             if chunk.strip():
-                chunks.append(chunk)
+                yield chunk
+
 
-        return chunks
+def _vector_array_literal(vectors: List[List[float]]) -> str:
+    """Render *vectors* as a Postgres ``vector[]`` literal."""
+    return "{" + ",".join(f'"[{",".join(map(str, v))}]"' for v in vectors) + "}"
 
 
 # Singleton instance
@@ -75,6 +75,20 @@ def test_get_chat_history():
     assert data["session_id"] == session_id
     assert len(data["messages"]) == 2
     assert data["total"] == 2
+    assert data["next_cursor"] is None
+
+    # Page back one message at a time
+    response = client.get(f"/memory/sessions/{session_id}/history?limit=1")
+    data = response.json()
+    assert [m["content"] for m in data["messages"]] == ["Reply 1"]
+    assert data["next_cursor"] == 1
+
+    response = client.get(
+        f"/memory/sessions/{session_id}/history?limit=1&cursor={data['next_cursor']}"
+    )
+    data = response.json()
+    assert [m["content"] for m in data["messages"]] == ["Message 1"]
+    assert data["next_cursor"] is None
 
 
 def test_update_and_get_learned_facts():
@@ -0,0 +1,93 @@
+"""Tests for the hallucination detector's heuristic shortcuts."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from core.hallucination_detector import (
+    HallucinationCheckResult,
+    HallucinationDetector,
+)
+from core.metrics_collector import ValidationStatus
+
+SHORT_CLEAN = "Python is a programming language."
+THREE_CLAIMS = "Python is popular. Rust is fast. Go is simple."
+FOUR_INDICATORS = "Always 50% and never 1999 2000 2001 2002 with 12345 67890."
+FIVE_INDICATORS = (
+    "Always 50% and never 1999 2000 2001 2002 with 12345 67890 (Smith et al., 2020)."
+)
+
+
+class StubAgent:
+    """Fact checker stand-in that returns a fixed verdict and counts calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def run(self, prompt: str) -> SimpleNamespace:
+        self.calls += 1
+        return SimpleNamespace(
+            content=HallucinationCheckResult(
+                is_hallucinated=False,
+                confidence_score=0.85,
+                claims=[],
+                hallucination_indicators=[],
+                reasoning="",
+                overall_assessment="",
+            )
+        )
+
+
+@pytest.fixture
+def agent():
+    return StubAgent()
+
+
+def test_short_clean_response_skips_deep_check(agent):
+    """Test a short response without indicators is settled heuristically."""
+    detector = HallucinationDetector(fact_check_agent=agent)
+
+    metrics = detector.check_response(SHORT_CLEAN)
+    assert metrics.status == ValidationStatus.UNVERIFIED
+    assert metrics.confidence_score == 0.9
+    assert agent.calls == 0
+
+    # A third claim is past the shortcut, so the fact checker runs
+    metrics = detector.check_response(THREE_CLAIMS)
+    assert metrics.status == ValidationStatus.VALID
+    assert metrics.confidence_score == 0.85
+    assert agent.calls == 1
+
+
+def test_many_indicators_skip_deep_check(agent):
+    """Test five or more quick indicators are settled heuristically."""
+    detector = HallucinationDetector(fact_check_agent=agent)
+
+    metrics = detector.check_response(FIVE_INDICATORS)
+    assert len(metrics.hallucination_indicators) == 5
+    assert metrics.status == ValidationStatus.HALLUCINATION
+    assert metrics.confidence_score == 0.2
+    assert agent.calls == 0
+
+    metrics = detector.check_response(FOUR_INDICATORS)
+    assert len(metrics.hallucination_indicators) == 4
+    assert metrics.status == ValidationStatus.VALID
+    assert agent.calls == 1
+
+
+@pytest.mark.parametrize(
+    "text, status, confidence",
+    [
+        (SHORT_CLEAN, ValidationStatus.UNVERIFIED, 0.7),
+        (FOUR_INDICATORS, ValidationStatus.HALLUCINATION, 0.3),
+        (FIVE_INDICATORS, ValidationStatus.HALLUCINATION, 0.3),
+    ],
+)
+def test_heuristics_without_deep_check(agent, text, status, confidence):
+    """Test the shortcuts leave the heuristic-only scores unchanged."""
+    detector = HallucinationDetector(fact_check_agent=agent, enable_deep_check=False)
+
+    metrics = detector.check_response(text)
+    assert metrics.status == status
+    assert metrics.confidence_score == confidence
+    assert agent.calls == 0
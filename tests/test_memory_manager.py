@@ -2,17 +2,19 @@
 
 import pytest
 from core.memory_manager import MemoryManager
+from sqlalchemy.pool import NullPool
 
 
 @pytest.fixture
 def memory_manager():
-    """Create memory manager instance."""
-    return MemoryManager()
+    """Create memory manager instance without a connection pool."""
+    return MemoryManager(poolclass=NullPool)
 
 
 def test_add_and_retrieve_messages(memory_manager):
     """Test adding and retrieving chat messages."""
     session_id = "test_session_1"
+    memory_manager.clear_session(session_id)
 
     # Add messages
     memory_manager.add_message(session_id, "user", "Hello!")
@@ -73,6 +75,7 @@ def test_clear_session(memory_manager):
 def test_history_limit(memory_manager):
     """Test chat history retrieval limit."""
     session_id = "test_session_5"
+    memory_manager.clear_session(session_id)
 
     # Add many messages
     for i in range(20):
@@ -84,3 +87,137 @@ def test_history_limit(memory_manager):
 
     # Messages should be most recent
     assert history[-1]["content"] == "Message 19"
+
+    # A repeated read is served from the history cache
+    hits = memory_manager.history_cache_hits
+    assert memory_manager.get_chat_history(session_id, limit=5) == history
+    assert memory_manager.history_cache_hits == hits + 1
+
+    # Adding a message updates the cached window in place
+    memory_manager.add_message(session_id, "user", "Message 20")
+    history = memory_manager.get_chat_history(session_id, limit=5)
+    assert history[-1]["content"] == "Message 20"
+    assert memory_manager.history_cache_hits == hits + 2
+
+
+def test_history_window():
+    """Test the in-process history window stays in step with the database."""
+    memory_manager = MemoryManager(poolclass=NullPool, max_history=5)
+    session_id = "test_session_6"
+    memory_manager.clear_session(session_id)
+
+    for i in range(8):
+        memory_manager.add_message(session_id, "user", f"Message {i}")
+
+    history = memory_manager.get_chat_history(session_id, limit=3)
+    assert [m["content"] for m in history] == ["Message 5", "Message 6", "Message 7"]
+
+    # New messages are appended to the cached window, dropping the oldest
+    memory_manager.add_message(session_id, "user", "Message 8")
+    hits = memory_manager.history_cache_hits
+    history = memory_manager.get_chat_history(session_id, limit=5)
+    assert [m["content"] for m in history] == [f"Message {i}" for i in range(4, 9)]
+    assert memory_manager.history_cache_hits == hits + 1
+
+    # Limits beyond the window are read from the database
+    history = memory_manager.get_chat_history(session_id, limit=7)
+    assert [m["content"] for m in history] == [f"Message {i}" for i in range(2, 9)]
+    assert memory_manager.history_cache_hits == hits + 1
+
+    # Cached reads hand out fresh dicts, so callers cannot edit the window
+    history = memory_manager.get_chat_history(session_id, limit=1)
+    history[0]["content"] = "edited"
+    assert memory_manager.get_chat_history(session_id, limit=1)[0]["content"] == (
+        "Message 8"
+    )
+
+
+def test_page_history():
+    """Test cursor pagination agrees inside and beyond the cached window."""
+    memory_manager = MemoryManager(poolclass=NullPool, max_history=5)
+    session_id = "test_session_7"
+    memory_manager.clear_session(session_id)
+
+    for i in range(12):
+        memory_manager.add_message(session_id, "user", f"Message {i}")
+
+    contents = []
+    cursor = 0
+    while cursor is not None:
+        page, cursor = memory_manager.page_history(session_id, cursor=cursor, limit=3)
+        contents[:0] = [m["content"] for m in page]
+
+    assert contents == [f"Message {i}" for i in range(12)]
+
+
+def test_add_message_during_window_load(memory_manager, monkeypatch):
+    """Test a window load racing a write caches the new message once."""
+    session_id = "test_session_9"
+    memory_manager.clear_session(session_id)
+    memory_manager.add_message(session_id, "user", "Before")
+    memory_manager.get_chat_history(session_id)
+
+    # Reload the window between the write's commit and its cache update
+    session_factory = memory_manager.SessionLocal
+
+    def interleaved_session():
+        session = session_factory()
+        commit = session.commit
+
+        def commit_then_load():
+            commit()
+            memory_manager._load_window(session_id)
+
+        session.commit = commit_then_load
+        return session
+
+    monkeypatch.setattr(memory_manager, "SessionLocal", interleaved_session)
+    memory_manager.add_message(session_id, "user", "During")
+    monkeypatch.undo()
+
+    hits = memory_manager.history_cache_hits
+    history = memory_manager.get_chat_history(session_id)
+    assert [m["content"] for m in history] == ["Before", "During"]
+    assert memory_manager.history_cache_hits == hits + 1
+
+
+def test_write_to_other_session_keeps_window_load(memory_manager, monkeypatch):
+    """Test only writes to the same session discard a window load in flight."""
+    session_id = "test_session_10"
+    other_session_id = "test_session_11"
+    for sid in (session_id, other_session_id):
+        memory_manager.clear_session(sid)
+    memory_manager.add_message(session_id, "user", "Hello")
+
+    # Write to another session while this session's window is being read
+    load_history = memory_manager._load_history
+
+    def load_during_write(sid, limit, offset=0):
+        rows = load_history(sid, limit, offset)
+        memory_manager.add_message(other_session_id, "user", "Elsewhere")
+        return rows
+
+    monkeypatch.setattr(memory_manager, "_load_history", load_during_write)
+    memory_manager.get_chat_history(session_id)
+    monkeypatch.undo()
+
+    hits = memory_manager.history_cache_hits
+    history = memory_manager.get_chat_history(session_id)
+    assert [m["content"] for m in history] == ["Hello"]
+    assert memory_manager.history_cache_hits == hits + 1
+
+
+def test_session_window_reuse(memory_manager):
+    """Test a cleared session's history window is recycled, not reallocated."""
+    session_id = "test_session_8"
+
+    memory_manager.add_message(session_id, "user", "First life")
+    memory_manager.get_chat_history(session_id)
+    window = memory_manager._history_cache[session_id]
+
+    memory_manager.clear_session(session_id)
+    memory_manager.add_message(session_id, "user", "Second life")
+    history = memory_manager.get_chat_history(session_id)
+
+    assert [m["content"] for m in history] == ["Second life"]
+    assert memory_manager._history_cache[session_id] is window
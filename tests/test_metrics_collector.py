@@ -0,0 +1,177 @@
+"""Tests for the metrics collector's columns, indexes and running totals."""
+
+import pytest
+
+from core.metrics_collector import MetricsCollector, ValidationStatus
+
+
+def _record(
+    collector: MetricsCollector,
+    execution_id: str,
+    agent_name: str,
+    status: ValidationStatus,
+    confidence: float,
+    duration_ms: float,
+    *,
+    finalize: bool = True,
+):
+    """Create an execution with fixed results, finalizing it by default."""
+    execution = collector.create_execution(execution_id)
+    execution.performance.agent_name = agent_name
+    execution.performance.duration_ms = duration_ms
+    execution.validation.status = status
+    execution.validation.confidence_score = confidence
+    if finalize:
+        collector.finalize(execution)
+    return execution
+
+
+def _ids(executions):
+    return [m.execution_id for m in executions]
+
+
+@pytest.fixture
+def collector() -> MetricsCollector:
+    collector = MetricsCollector(max_history=100)
+    _record(collector, "a1", "alpha", ValidationStatus.VALID, 0.9, 10.0)
+    _record(collector, "b1", "beta", ValidationStatus.INVALID, 0.1, 30.0)
+    _record(collector, "a2", "alpha", ValidationStatus.HALLUCINATION, 0.3, 20.0)
+    _record(collector, "a3", "alpha", ValidationStatus.VALID, 0.8, 40.0)
+    return collector
+
+
+def test_get_metrics_filters_by_agent_and_status(collector):
+    """Test filters combine and keep executions in creation order."""
+    assert _ids(collector.get_metrics()) == ["a1", "b1", "a2", "a3"]
+    assert _ids(collector.get_metrics(limit=2)) == ["a2", "a3"]
+    assert _ids(collector.get_metrics(filter_by={"agent_name": "alpha"})) == [
+        "a1",
+        "a2",
+        "a3",
+    ]
+    assert _ids(
+        collector.get_metrics(
+            filter_by={"agent_name": "alpha", "status": ValidationStatus.VALID}
+        )
+    ) == ["a1", "a3"]
+    assert _ids(collector.get_metrics(filter_by={"status": "invalid"})) == ["b1"]
+    # The limit bounds the window the filter is applied to
+    assert _ids(collector.get_metrics(limit=2, filter_by={"agent_name": "beta"})) == []
+
+
+def test_get_agent_stats(collector):
+    """Test per-agent statistics cover only that agent's executions."""
+    stats = collector.get_agent_stats("alpha")
+
+    assert stats["total_executions"] == 3
+    assert stats["avg_duration_ms"] == pytest.approx(70.0 / 3)
+    assert stats["avg_confidence"] == pytest.approx(2.0 / 3)
+    assert stats["validation_stats"] == {"valid": 2, "hallucination": 1}
+    assert collector.get_agent_stats("unknown")["total_executions"] == 0
+
+
+def test_aggregated_stats(collector):
+    """Test collector-wide totals and histogram percentiles."""
+    stats = collector.get_aggregated_stats()
+
+    assert stats["total_executions"] == 4
+    assert stats["validation"]["status_counts"] == {
+        "valid": 2,
+        "invalid": 1,
+        "hallucination": 1,
+    }
+    assert stats["validation"]["valid_percentage"] == 50.0
+    assert stats["validation"]["avg_confidence_score"] == pytest.approx(0.525)
+    performance = stats["performance"]
+    assert performance["avg_duration_ms"] == 25.0
+    assert performance["min_duration_ms"] == 10.0
+    assert performance["max_duration_ms"] == 40.0
+    # Histogram percentiles are accurate to about 1%
+    assert performance["p50_duration_ms"] == pytest.approx(30.0, rel=0.02)
+    assert performance["p95_duration_ms"] == pytest.approx(40.0, rel=0.02)
+
+
+def test_pending_executions_count_as_unverified_until_finalized():
+    """Test in-flight executions are listed and counted, then recorded once."""
+    collector = MetricsCollector()
+    _record(collector, "done", "alpha", ValidationStatus.VALID, 1.0, 5.0)
+    pending = _record(
+        collector, "open", "alpha", ValidationStatus.VALID, 0.5, 7.0, finalize=False
+    )
+
+    stats = collector.get_aggregated_stats()
+    assert stats["total_executions"] == 2
+    assert stats["validation"]["status_counts"] == {"valid": 1, "unverified": 1}
+    assert stats["performance"]["max_duration_ms"] == 5.0
+    # Unindexed pending rows still match filters directly
+    assert _ids(collector.get_metrics(filter_by={"agent_name": "alpha"})) == [
+        "done",
+        "open",
+    ]
+    assert collector.get_agent_stats("alpha")["total_executions"] == 1
+
+    collector.finalize(pending)
+    collector.finalize(pending)  # repeated calls are ignored
+
+    stats = collector.get_aggregated_stats()
+    assert stats["validation"]["status_counts"] == {"valid": 2}
+    assert stats["performance"]["max_duration_ms"] == 7.0
+    assert collector.get_agent_stats("alpha")["total_executions"] == 2
+
+
+def test_history_wraps_around_max_history():
+    """Test the ring buffer keeps the newest rows while totals cover all."""
+    collector = MetricsCollector(max_history=4)
+    for i in range(10):
+        agent_name = "even" if i % 2 == 0 else "odd"
+        _record(collector, f"e{i}", agent_name, ValidationStatus.VALID, 0.5, float(i))
+
+    assert _ids(collector.get_metrics()) == ["e6", "e7", "e8", "e9"]
+    assert _ids(collector.get_metrics(filter_by={"agent_name": "odd"})) == ["e7", "e9"]
+
+    # Per-agent statistics read the retained window's column slots
+    odd = collector.get_agent_stats("odd")
+    assert odd["total_executions"] == 2
+    assert odd["avg_duration_ms"] == 8.0
+
+    stats = collector.get_aggregated_stats()
+    assert stats["total_executions"] == 10
+    assert stats["performance"]["avg_duration_ms"] == 4.5
+    assert stats["performance"]["min_duration_ms"] == 0.0
+
+
+def test_evicted_pending_execution_still_counts():
+    """Test an execution dropped before finishing is folded into the totals."""
+    collector = MetricsCollector(max_history=2)
+    _record(
+        collector, "stale", "alpha", ValidationStatus.VALID, 1.0, 3.0, finalize=False
+    )
+    _record(collector, "e1", "alpha", ValidationStatus.VALID, 1.0, 1.0)
+    _record(collector, "e2", "alpha", ValidationStatus.INVALID, 0.0, 2.0)
+
+    stats = collector.get_aggregated_stats()
+    assert stats["total_executions"] == 3
+    assert stats["validation"]["status_counts"] == {"valid": 2, "invalid": 1}
+    assert stats["performance"]["max_duration_ms"] == 3.0
+    assert _ids(collector.get_metrics()) == ["e1", "e2"]
+
+
+def test_text_lengths_recorded_on_finalize():
+    """Test lengths are reported before finalizing and recorded on freeze."""
+    collector = MetricsCollector()
+    execution = collector.create_execution("e1")
+    execution.input_text = "hello"
+    execution.output_text = "hi"
+
+    data = execution.to_dict()
+    assert (data["input_length"], data["output_length"]) == (5, 2)
+    assert execution.input_length == 0
+
+    execution.output_text = "hi there"
+    assert execution.to_dict()["output_length"] == 8
+
+    collector.finalize(execution)
+    data = execution.to_dict()
+    assert (data["input_length"], data["output_length"]) == (5, 8)
+    assert (execution.input_length, execution.output_length) == (5, 8)
+    assert execution.to_dict() is data
@@ -5,18 +5,32 @@ from __future__ import annotations
 import textwrap
 from pathlib import Path
 
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
 from agno.tools.duckduckgo import DuckDuckGoTools
 
 from core import skill_orchestrator
+from core.loaders.yaml_loader import load_yaml
 from core.orchestrator import SkillOrchestrator
+from core.skills.models import SkillMatchProfile, SkillMetadata
 from core.skills.scaffold import create_skill_package
+from core.skills.term_index import SkillTermIndex
+from core.skills.validation import SkillMetadataModel
 from app.api.skills import router as skills_router
 from scripts import create_skill
+from shared.tools.references import reference_index
 
+skills_app = FastAPI()
+skills_app.include_router(skills_router)
+skills_client = TestClient(skills_app)
 
-def _make_orchestrator() -> SkillOrchestrator:
+
+@pytest.fixture(scope="module")
+def orchestrator() -> SkillOrchestrator:
+    # Discovery parses every skill manifest and imports its tool modules;
+    # tests that only read from the orchestrator share one instance.
     project_root = Path(__file__).resolve().parent.parent
     return SkillOrchestrator(
         skills_path=project_root / "skills",
@@ -26,21 +40,24 @@ def _make_orchestrator() -> SkillOrchestrator:
     )
 
 
-def test_skill_registry_catalog_contains_expected_skills() -> None:
-    orchestrator = _make_orchestrator()
+def test_skill_registry_catalog_contains_expected_skills(
+    orchestrator: SkillOrchestrator,
+) -> None:
     skill_ids = {metadata.id for metadata in orchestrator.catalog()}
     assert {"web_search", "agno_docs", "finance_research"}.issubset(skill_ids)
 
 
-def test_load_skill_returns_tools_and_instructions() -> None:
-    orchestrator = _make_orchestrator()
+def test_load_skill_returns_tools_and_instructions(
+    orchestrator: SkillOrchestrator,
+) -> None:
     package = orchestrator.registry.load_skill("web_search")
     assert "Web Search Skill" in package.instructions
     assert any(isinstance(tool, DuckDuckGoTools) for tool in package.tools)
 
 
-def test_build_context_merges_shared_prompt_and_skills() -> None:
-    orchestrator = _make_orchestrator()
+def test_build_context_merges_shared_prompt_and_skills(
+    orchestrator: SkillOrchestrator,
+) -> None:
     context = orchestrator.build_context(
         skill_ids=["agno_docs", "web_search"],
         extra_instructions="Keep answers short when possible.",
@@ -52,24 +69,92 @@ def test_build_context_merges_shared_prompt_and_skills() -> None:
     assert any(path.name == "README.md" for path in context.references)
 
 
-def test_build_for_agent_uses_configuration_defaults() -> None:
-    orchestrator = _make_orchestrator()
+def test_build_for_agent_uses_configuration_defaults(
+    orchestrator: SkillOrchestrator,
+) -> None:
     context = orchestrator.build_for_agent("web-search-agent")
 
     assert any(skill.id == "web_search" for skill in context.skills)
     assert "Operate under the codename WebX" in context.instructions
 
 
-def test_route_skills_prefers_relevant_match_terms() -> None:
-    orchestrator = _make_orchestrator()
+def test_route_skills_prefers_relevant_match_terms(
+    orchestrator: SkillOrchestrator,
+) -> None:
     matches = orchestrator.route_skills("Need a quick Agno tutorial")
 
     assert matches
     assert matches[0].id == "agno_docs"
 
 
-def test_route_and_build_appends_auto_skills_when_message_matches() -> None:
-    orchestrator = _make_orchestrator()
+def test_route_skills_batch_matches_single_routing(
+    orchestrator: SkillOrchestrator,
+) -> None:
+    messages = [
+        "Need a quick Agno tutorial",
+        "Compare NVDA and AMD valuations",
+        "",
+        "Need a quick Agno tutorial",
+    ]
+
+    batched = orchestrator.route_skills_batch(messages, limit=2)
+
+    assert batched == [orchestrator.route_skills(m, limit=2) for m in messages]
+    assert batched[2] == []
+
+
+def test_term_index_candidates_follow_router_relations() -> None:
+    profiles = [
+        SkillMatchProfile.from_metadata(
+            SkillMetadata(
+                id="finance",
+                name="Finance",
+                description="Quarterly reports",
+                root=Path("finance"),
+                tags=("markets",),
+                match_terms=("valuation", "pe ratio"),
+            )
+        ),
+        SkillMatchProfile.from_metadata(
+            SkillMetadata(
+                id="docs",
+                name="Docs",
+                description="Framework guides",
+                root=Path("docs"),
+                match_terms=("c++",),
+            )
+        ),
+    ]
+    index = SkillTermIndex(profiles)
+
+    assert index.candidates("quarterly") == {0}  # description word
+    assert index.candidates("supermarkets") == {0}  # tag inside the token
+    assert index.candidates("ratio") == {0}  # word of a phrase
+    assert index.candidates("c") == {1}  # token inside a term
+    assert index.candidates("valuatoin") == {0}  # fuzzy match term
+    # Description words and tags are only ever matched exactly or as substrings
+    assert index.candidates("quarterlyy") == set()
+    assert index.candidates("guidez") == set()
+
+
+@pytest.mark.parametrize("tags", [5, True, {"web": 1}])
+def test_skill_metadata_rejects_non_list_sequences(tags) -> None:
+    with pytest.raises(ValidationError):
+        SkillMetadataModel(
+            id="demo", name="Demo", description="Demo", root=Path("."), tags=tags
+        )
+
+    # Bare strings and empty values still normalise to an empty tuple
+    for empty in ("web", None, []):
+        model = SkillMetadataModel(
+            id="demo", name="Demo", description="Demo", root=Path("."), tags=empty
+        )
+        assert model.tags == ()
+
+
+def test_route_and_build_appends_auto_skills_when_message_matches(
+    orchestrator: SkillOrchestrator,
+) -> None:
     context = orchestrator.route_and_build(
         "web-search-agent",
         message="Find the latest technology news",
@@ -78,8 +163,9 @@ def test_route_and_build_appends_auto_skills_when_message_matches() -> None:
     assert any(skill.id == "web_search" for skill in context.skills)
 
 
-def test_finance_request_triggers_finance_skill() -> None:
-    orchestrator = _make_orchestrator()
+def test_finance_request_triggers_finance_skill(
+    orchestrator: SkillOrchestrator,
+) -> None:
     context = orchestrator.route_and_build(
         "web-search-agent",
         message="Compare NVDA and AMD valuations",
@@ -106,22 +192,18 @@ def test_create_skill_package(tmp_path: Path) -> None:
 
 
 def test_skills_router_endpoints() -> None:
-    app = FastAPI()
-    app.include_router(skills_router)
-    client = TestClient(app)
-
-    response = client.get("/skills")
+    response = skills_client.get("/skills")
     assert response.status_code == 200
     assert any(item["id"] == "web_search" for item in response.json())
 
-    route_response = client.post(
+    route_response = skills_client.post(
         "/skills/route", json={"message": "Compare NVDA and AMD valuations"}
     )
     assert route_response.status_code == 200
     routed_ids = [item["id"] for item in route_response.json()["skills"]]
     assert "finance_research" in routed_ids
 
-    reload_response = client.post("/skills/reload")
+    reload_response = skills_client.post("/skills/reload")
     assert reload_response.status_code == 200
 
 
@@ -158,6 +240,52 @@ def test_register_skill_updates_config(tmp_path: Path) -> None:
     assert updated == config_path.read_text(encoding="utf-8")
 
 
+def test_register_skill_keeps_comments_in_place(tmp_path: Path) -> None:
+    config_path = tmp_path / "skills_config.yaml"
+    config_path.write_text(
+        """agents:
+  agno-assist:
+    skills:
+      auto:
+        additional:
+          - demo_skill  # registered by hand
+          - other_skill
+    # keep this comment
+""",
+        encoding="utf-8",
+    )
+
+    create_skill._register_skill(tmp_path, "new_skill", config_path)
+    updated = config_path.read_text(encoding="utf-8")
+    assert "# registered by hand" in updated
+    assert "# keep this comment" in updated
+    auto = load_yaml(updated)["agents"]["agno-assist"]["skills"]["auto"]
+    assert auto["additional"] == ["demo_skill", "other_skill", "new_skill"]
+
+    # Items with trailing comments are still recognised as registered
+    create_skill._register_skill(tmp_path, "demo_skill", config_path)
+    assert updated == config_path.read_text(encoding="utf-8")
+
+
+def test_register_skill_ignores_other_additional_lists(tmp_path: Path) -> None:
+    config_path = tmp_path / "skills_config.yaml"
+    config_path.write_text(
+        """agents:
+  agno-assist:
+    tools:
+      additional:
+        - web_tool
+""",
+        encoding="utf-8",
+    )
+
+    create_skill._register_skill(tmp_path, "demo_skill", config_path)
+
+    agent = load_yaml(config_path.read_text(encoding="utf-8"))["agents"]["agno-assist"]
+    assert agent["tools"]["additional"] == ["web_tool"]
+    assert agent["skills"]["auto"]["additional"] == ["demo_skill"]
+
+
 def test_reload_shared_assets_refreshes_prompt_and_tools(tmp_path: Path) -> None:
     shared_dir = tmp_path / "shared"
     tools_dir = shared_dir / "tools"
@@ -233,8 +361,9 @@ def test_reload_shared_assets_refreshes_prompt_and_tools(tmp_path: Path) -> None
     assert "updated_shared_tool" in refreshed_tool_names
 
 
-def test_reference_search_tool_bound_to_context() -> None:
-    orchestrator = _make_orchestrator()
+def test_reference_search_tool_bound_to_context(
+    orchestrator: SkillOrchestrator,
+) -> None:
     context = orchestrator.build_context(skill_ids=["agno_docs"], include_shared=True)
 
     # Verify search tool is present
@@ -243,3 +372,57 @@ def test_reference_search_tool_bound_to_context() -> None:
 
     # Verify references are loaded
     assert len(context.references) > 0
+
+
+def test_reference_index_ranks_paragraphs(tmp_path: Path) -> None:
+    guide = tmp_path / "guide.md"
+    guide.write_text(
+        "Agents call tools to act on the world.\n\n"
+        "Custom tools wrap a function. Custom tools need a docstring.\n\n"
+        "Memory stores chat history.\n"
+    )
+    index = reference_index([("demo", guide)])
+
+    hits = index.search("custom tools", limit=2)
+    assert [chunk.chunk_index for _, chunk in hits] == [1, 0]
+    assert hits[0][1].read() == (
+        "Custom tools wrap a function. Custom tools need a docstring."
+    )
+    assert hits[0][0] > hits[1][0]
+    assert index.search("unrelated", limit=2) == []
+
+    # Unchanged files reuse the index; edits rebuild it
+    assert reference_index([("demo", guide)]) is index
+    guide.write_text("Workflows chain agents.\n\nTools too.\n")
+    rebuilt = reference_index([("".join(["de", "mo"]), guide)])
+    assert [chunk.read() for _, chunk in rebuilt.search("tools")] == ["Tools too."]
+
+    # Skill ids are interned, so rebuilt chunks share the original string
+    assert rebuilt.chunks[0].skill_id is index.chunks[0].skill_id
+
+
+def test_build_context_reuses_assembly_until_reload(tmp_path: Path) -> None:
+    prompt_path = tmp_path / "prompt.md"
+    prompt_path.write_text("Shared prompt v1")
+    project_root = Path(__file__).resolve().parent.parent
+    orchestrator = SkillOrchestrator(
+        skills_path=project_root / "skills",
+        shared_prompt_path=prompt_path,
+    )
+
+    first = orchestrator.build_context(skill_ids=["agno_docs"])
+    second = orchestrator.build_context(skill_ids=["agno_docs"])
+    assert orchestrator._assemble_cached.cache_info().hits == 1
+    assert second.instructions == first.instructions
+    assert second.tools == first.tools and second.tools is not first.tools
+
+    # Callers may extend the lists they receive without touching the cache
+    first.tools.append(object())
+    assert len(orchestrator.build_context(skill_ids=["agno_docs"]).tools) == len(
+        second.tools
+    )
+
+    prompt_path.write_text("Shared prompt v2")
+    orchestrator.reload_shared_assets()
+    refreshed = orchestrator.build_context(skill_ids=["agno_docs"])
+    assert refreshed.instructions.startswith("Shared prompt v2")
@@ -0,0 +1,175 @@
+"""Tests for the pgvector-backed reference store."""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import delete, select
+
+from shared.tools import vector_references
+from shared.tools.vector_references import ReferenceDocument, VectorReferenceStore
+
+SKILL_ID = "test_vector_skill"
+
+
+class FakeEmbeddings:
+    """Stand-in for the OpenAI embeddings API that counts requests."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, input, model):
+        self.calls += 1
+        data = [
+            SimpleNamespace(index=i, embedding=[float(len(text))] * 1536)
+            for i, text in enumerate(input)
+        ]
+        # The API does not promise to return items in input order
+        return SimpleNamespace(data=data[::-1])
+
+
+@pytest.fixture
+def store():
+    """Create a vector store whose embedder never leaves the process."""
+    store = VectorReferenceStore()
+    embeddings = FakeEmbeddings()
+    store._embedder = SimpleNamespace(client=SimpleNamespace(embeddings=embeddings))
+    yield store
+    with store.SessionLocal() as session:
+        session.execute(
+            delete(ReferenceDocument).where(ReferenceDocument.skill_id == SKILL_ID)
+        )
+        session.commit()
+
+
+def test_embedder_is_created_once():
+    """Test the real embedder is built from the configured model and reused."""
+    store = VectorReferenceStore(embedding_model="text-embedding-3-small")
+
+    embedder = store.embedder
+    assert type(embedder).__name__ == "OpenAIEmbedder"
+    assert embedder.id == "text-embedding-3-small"
+    assert store.embedder is embedder
+
+
+@pytest.mark.skipif(
+    not os.getenv("OPENAI_API_KEY"), reason="Requires OpenAI API key for embeddings"
+)
+def test_embed_batch_with_real_embedder():
+    """Test a batch round-trips through the unstubbed embeddings client."""
+    store = VectorReferenceStore()
+
+    embeddings = store._embed_batch(["Agno agents", "pgvector search"])
+    assert len(embeddings) == 2
+    assert all(len(embedding) == 1536 for embedding in embeddings)
+
+
+def test_embed_references_batches_requests(store, tmp_path, monkeypatch):
+    """Test chunks are embedded a batch per request and stored with their vectors."""
+    monkeypatch.setattr(vector_references, "EMBEDDING_BATCH_SIZE", 4)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"ref_{i}.md"
+        path.write_text(f"{i} " * 1500)
+        paths.append(path)
+
+    indexed = store.embed_references(SKILL_ID, paths, chunk_size=400)
+
+    assert indexed == 30
+    assert store.embedder.client.embeddings.calls == 8
+
+    # Unchanged files are not embedded again
+    assert store.embed_references(SKILL_ID, paths, chunk_size=400) == 0
+    assert store.embedder.client.embeddings.calls == 8
+
+    with store.SessionLocal() as session:
+        rows = session.execute(
+            select(ReferenceDocument.content, ReferenceDocument.embedding).where(
+                ReferenceDocument.skill_id == SKILL_ID
+            )
+        ).all()
+    assert len(rows) == indexed
+    assert all(embedding[0] == len(content) for content, embedding in rows)
+
+
+def test_batch_vector_reference_search(store, tmp_path, monkeypatch):
+    """Test the batch endpoint answers every query from one embeddings request."""
+    from fastapi.testclient import TestClient
+
+    from app.api import references
+    from app.main import app
+
+    path = tmp_path / "ref.md"
+    path.write_text("tools " * 400)
+    indexed = store.embed_references(SKILL_ID, [path], chunk_size=400)
+    calls = store.embedder.client.embeddings.calls
+    monkeypatch.setattr(references, "get_vector_store", lambda: store)
+
+    queries = ["custom tools", "agent memory", "workflows"]
+    response = TestClient(app).post(
+        "/references/search/batch",
+        json={"queries": queries, "skill_id": SKILL_ID, "limit": 2},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["queries"] == queries
+    assert len(data["results"]) == len(queries)
+    assert all(len(rows) == min(2, indexed) for rows in data["results"])
+    assert all(
+        row["skill_id"] == SKILL_ID and row["similarity"] is not None
+        for rows in data["results"]
+        for row in rows
+    )
+    assert store.embedder.client.embeddings.calls == calls + 1
+
+
+def test_embed_endpoint_runs_off_the_event_loop(store, monkeypatch):
+    """Test /references/embed indexes a skill's references on a worker thread."""
+    import asyncio
+
+    from fastapi.testclient import TestClient
+
+    from app.api import references
+    from app.main import app
+
+    on_event_loop = []
+    embed_references = store.embed_references
+
+    def record_loop(*args, **kwargs):
+        try:
+            asyncio.get_running_loop()
+            on_event_loop.append(True)
+        except RuntimeError:
+            on_event_loop.append(False)
+        return embed_references(*args, **kwargs)
+
+    monkeypatch.setattr(store, "embed_references", record_loop)
+    monkeypatch.setattr(references, "get_vector_store", lambda: store)
+
+    # agno_docs may already be indexed; only the rows this call adds are removed
+    with store.SessionLocal() as session:
+        existing_ids = set(
+            session.scalars(
+                select(ReferenceDocument.id).where(
+                    ReferenceDocument.skill_id == "agno_docs"
+                )
+            )
+        )
+
+    try:
+        response = TestClient(app).post(
+            "/references/embed", json={"skill_id": "agno_docs", "chunk_size": 800}
+        )
+        assert response.status_code == 200
+        assert response.json()["status"] == "completed"
+        assert on_event_loop == [False]
+    finally:
+        with store.SessionLocal() as session:
+            session.execute(
+                delete(ReferenceDocument).where(
+                    ReferenceDocument.skill_id == "agno_docs",
+                    ReferenceDocument.id.not_in(existing_ids),
+                )
+            )
+            session.commit()